@@ -1,10 +1,13 @@
 import os
 import copy
 import warnings
-import multiprocessing as mp
+import tempfile
+import zlib
+import base64
+import itertools
 from functools import partial
 import typing
-from typing import Optional, Union, TextIO, Sequence, Dict
+from typing import Optional, Union, TextIO, Sequence, Dict, Iterator, List, Type
 from pathlib import Path
 
 import numpy as np
@@ -19,13 +22,138 @@ from . import Rotation
 from . import Table
 from . import Colormap
 from ._typehints import FloatSequence, IntSequence, NumpyRngSeed
-try:
-    import numba as nb                                                                              # type: ignore
-except ImportError:
-    nb = False
 
-def numba_njit_wrapper(**kwargs):
-    return (lambda function: nb.njit(function) if nb else function)
+
+def _slabs(N_cells_layer: int,
+           N_layers: int) -> Iterator[slice]:
+    """Slices of layers along z of slabs with a bounded number of cells."""
+    N = max(1,2**24//int(N_cells_layer))
+    return (slice(z,min(z+N,N_layers)) for z in range(0,N_layers,N))
+
+
+def _compact_dtype(minimum: int,
+                   maximum: int) -> np.dtype:
+    """Smallest signed integer type with at least 16 bit that can hold the given range."""
+    types: List[Type[np.signedinteger]] = [np.int16,np.int32,np.int64]
+    for t in types:
+        if int(np.iinfo(t).min) <= minimum and maximum <= int(np.iinfo(t).max):
+            return np.dtype(t)
+    return np.dtype(np.int64)
+
+
+def _fitting_dtype(dtype: np.dtype,
+                   *values: Union[int, float]) -> np.dtype:
+    """Data type that can hold values of the given integer type and the given values."""
+    if dtype.kind not in 'iu' or len(values) == 0:
+        return dtype
+    fitting = np.promote_types(dtype,_compact_dtype(int(min(values)),int(max(values))))
+    return fitting if fitting.kind in 'iu' else np.dtype(np.int64)
+
+
+def _VTI_dtype(data: np.ndarray) -> np.dtype:
+    """Data type for storing in a VTK ImageData file readable by the grid solver (Int32/64, Float32/64)."""
+    if data.dtype.kind == 'f':
+        return np.dtype(np.float32 if data.dtype.itemsize <= 4 else np.float64)
+    return np.dtype(np.int32 if data.size == 0 or np.iinfo(np.int32).min <= np.min(data) and
+                                                  np.max(data) <= np.iinfo(np.int32).max else np.int64)
+
+
+def _empty(shape: Union[np.ndarray, Sequence[int]],
+           dtype: np.dtype,
+           like: np.ndarray) -> np.ndarray:
+    """Uninitialized array, memory-mapped to an anonymous temporary file if 'like' is memory-mapped."""
+    if isinstance(like,np.memmap):
+        return np.memmap(tempfile.TemporaryFile(),dtype,'w+',shape=tuple(int(c) for c in shape),order='F')
+    return np.empty(tuple(int(c) for c in shape),dtype)
+
+
+def _unique(material: np.ndarray) -> np.ndarray:
+    """Sorted unique values, determined slab by slab for memory-mapped arrays."""
+    if not isinstance(material,np.memmap):
+        return np.unique(material)
+    return np.unique(np.concatenate([np.unique(material[:,:,z])
+                                     for z in _slabs(int(np.prod(material.shape[:2])),material.shape[2])]))
+
+
+def _save_VTI(fname: Union[str, Path],
+              size: np.ndarray,
+              origin: np.ndarray,
+              data: Dict[str, np.ndarray],
+              comments: Sequence[str],
+              compress: bool):
+    """
+    Stream cell data slab by slab to a VTK ImageData file.
+
+    The data is stored inline in base64-encoded binary format with
+    64 bit headers and, if compressed, with one zlib block per slab.
+
+    """
+    cells = np.array(next(iter(data.values())).shape)
+    types = {np.dtype(np.int32):'Int32',np.dtype(np.int64):'Int64',
+             np.dtype(np.float32):'Float32',np.dtype(np.float64):'Float64'}
+    extent = ' '.join(f'0 {c}' for c in cells)
+
+    def encode(f,
+               chunks: Iterator[bytes]):
+        """Write base64 encoding of concatenated chunks."""
+        rest = b''
+        for chunk in chunks:
+            chunk = rest + chunk
+            f.write(base64.b64encode(chunk[:len(chunk)//3*3]))
+            rest = chunk[len(chunk)//3*3:]
+        f.write(base64.b64encode(rest))
+
+    def write(f,
+              blocks: Iterator[bytes],
+              N_blocks: int,
+              N_bytes: int):
+        """Write data array with header."""
+        if not compress:
+            encode(f,itertools.chain([np.array([N_bytes],'<u8').tobytes()],blocks))
+        else:
+            start = f.tell()
+            f.write(base64.b64encode(bytes(8*(3+N_blocks))))
+            sizes = []
+            def deflate(blocks: Iterator[bytes]) -> Iterator[bytes]:
+                for b in blocks:
+                    compressed = zlib.compress(b)
+                    sizes.append((len(b),len(compressed)))
+                    yield compressed
+            encode(f,deflate(blocks))
+            end = f.tell()
+            f.seek(start)
+            f.write(base64.b64encode(np.array([N_blocks,sizes[0][0],sizes[-1][0]]+[c for _,c in sizes],'<u8').tobytes()))
+            f.seek(end)
+
+    with open(fname,'wb') as f:
+        f.write('\n'.join(['<?xml version="1.0"?>',
+                           '<VTKFile type="ImageData" version="1.0" byte_order="LittleEndian" header_type="UInt64"'
+                           +(' compressor="vtkZLibDataCompressor">' if compress else '>'),
+                           f'  <ImageData WholeExtent="{extent}" Origin="{" ".join(map(repr,map(float,origin)))}" '
+                           f'Spacing="{" ".join(map(repr,map(float,size/cells)))}" Direction="1 0 0 0 1 0 0 0 1">',
+                           '    <FieldData>',
+                           f'      <Array type="String" Name="comments" NumberOfTuples="{len(comments)}" format="binary">',
+                           '        ']).encode())
+        comments_ = b''.join(c.encode()+b'\0' for c in comments)
+        write(f,iter([comments_]),1,len(comments_))
+        f.write('\n'.join(['',
+                           '      </Array>',
+                           '    </FieldData>',
+                           f'  <Piece Extent="{extent}">',
+                           '    <PointData>',
+                           '    </PointData>',
+                           '    <CellData>','']).encode())
+        for label,d in data.items():
+            dtype = _VTI_dtype(d)
+            f.write(f'      <DataArray type="{types[dtype]}" Name="{label}" format="binary">\n        '.encode())
+            slabs = list(_slabs(cells[0]*cells[1],cells[2]))
+            write(f,(np.asarray(d[:,:,z],dtype.newbyteorder('<')).tobytes(order='F') for z in slabs),
+                  len(slabs),d.size*dtype.itemsize)
+            f.write(b'\n      </DataArray>\n')
+        f.write('\n'.join(['    </CellData>',
+                           '  </Piece>',
+                           '  </ImageData>',
+                           '</VTKFile>','']).encode())
 
 
 class GeomGrid:
@@ -51,7 +179,8 @@ class GeomGrid:
         ----------
         material : numpy.ndarray of int, shape (:,:,:)
             Material indices. The shape of the material array defines
-            the number of cells.
+            the number of cells. A numpy.memmap, e.g. from
+            numpy.load(fname,mmap_mode='r'), is used without copying.
         size : sequence of float, len (3)
             Physical size of grid in meter.
         origin : sequence of float, len (3), optional
@@ -61,6 +190,14 @@ class GeomGrid:
         comments : (sequence of) str, optional
             Additional, human-readable information, e.g. history of operations.
 
+        Notes
+        -----
+        GeomGrid objects with memory-mapped material indices are
+        processed out-of-core, i.e. slab by slab along z, by 'canvas',
+        'mirror', 'renumber', 'substitute', 'sort', and 'save'.
+        Their results are memory-mapped to anonymous temporary files.
+        Slabs along z are contiguous in Fortran ('F') order.
+
         """
         self.material = material
         self.size = size                                                                            # type: ignore
@@ -132,14 +269,21 @@ class GeomGrid:
                  material: np.ndarray):
         if len(material.shape) != 3:
             raise ValueError(f'invalid material shape {material.shape}')
-        if material.dtype not in np.sctypes['float'] and material.dtype not in np.sctypes['int']:
+        if material.dtype not in np.sctypes['float'] and material.dtype not in np.sctypes['int'] \
+                                                      and material.dtype not in np.sctypes['uint']:
             raise TypeError(f'invalid material data type "{material.dtype}"')
 
-        self._material = np.copy(material)
+        if isinstance(material,np.memmap):
+            self._material: np.ndarray = material
+            return
 
-        if self.material.dtype in np.sctypes['float'] and \
-           np.all(self.material == self.material.astype(np.int64).astype(float)):
-            self._material = self.material.astype(np.int64)
+        if material.dtype in np.sctypes['float'] and \
+           np.all(material == material.astype(np.int64).astype(float)):
+            material = material.astype(np.int64)
+
+        self._material = np.array(material,_compact_dtype(int(np.min(material)),int(np.max(material)))) \
+                         if material.dtype.kind in 'iu' and material.size > 0 else \
+                         np.copy(material)
 
 
     @property
@@ -193,7 +337,7 @@ class GeomGrid:
     @property
     def N_materials(self) -> int:
         """Number of (unique) material indices within grid."""
-        return np.unique(self.material).size
+        return _unique(self.material).size
 
 
     @staticmethod
@@ -511,12 +655,6 @@ class GeomGrid:
                        )
 
 
-    @staticmethod
-    def _find_closest_seed(seeds: np.ndarray,
-                           weights: np.ndarray,
-                           point: np.ndarray) -> np.integer:
-        return np.argmin(np.sum((np.broadcast_to(point,(len(seeds),3))-seeds)**2,axis=1) - weights)
-
     @staticmethod
     def from_Laguerre_tessellation(cells: IntSequence,
                                    size: FloatSequence,
@@ -551,25 +689,51 @@ class GeomGrid:
             GeomGrid-based geometry from tessellation.
 
         """
-        weights_p: FloatSequence
-        if periodic:
-            weights_p = np.tile(weights,27)                                                         # Laguerre weights (1,2,3,1,2,3,...,1,2,3)
-            seeds_p = np.vstack((seeds  -np.array([size[0],0.,0.]),seeds,  seeds  +np.array([size[0],0.,0.])))
-            seeds_p = np.vstack((seeds_p-np.array([0.,size[1],0.]),seeds_p,seeds_p+np.array([0.,size[1],0.])))
-            seeds_p = np.vstack((seeds_p-np.array([0.,0.,size[2]]),seeds_p,seeds_p+np.array([0.,0.,size[2]])))
+        weights_ = np.array(weights,float)
+        size_ = np.array(size,float)
+        if np.any(np.isposinf(weights_)):                                                           # only seeds with infinite weight compete
+            candidates = np.isposinf(weights_)
+            weights_ = np.zeros_like(weights_)
         else:
-            weights_p = np.array(weights,float)
-            seeds_p   = seeds
+            candidates = np.isfinite(weights_)
+        if not np.any(candidates): candidates[0] = True
 
         coords = grid_filters.coordinates0_point(cells,size).reshape(-1,3)
-
-        pool = mp.Pool(int(os.environ.get('OMP_NUM_THREADS',4)))
-        result = pool.map_async(partial(GeomGrid._find_closest_seed,seeds_p,weights_p), coords)
-        pool.close()
-        pool.join()
-        material_ = np.array(result.get()).reshape(cells)
-
-        if periodic: material_ %= len(weights)
+        material_ = np.empty(len(coords),np.int64)
+        todo = np.arange(len(coords))
+        margin = 2.*np.cbrt(np.prod(size_)/len(seeds)) + np.sqrt(np.ptp(weights_[candidates]))        # periodic images near faces
+        shifts = np.array(np.meshgrid(*[[-1,0,1]]*3,indexing='ij')).reshape(3,-1).T*size_
+
+        while len(todo) > 0:
+            ID = np.arange(len(seeds))[candidates]
+            seeds_p = seeds[candidates]
+            weights_p = weights_[candidates]
+            if periodic:
+                seeds_p = (seeds_p+shifts.reshape(-1,1,3)).reshape(-1,3)
+                weights_p = np.tile(weights_p,len(shifts))
+                ID = np.tile(ID,len(shifts))
+                near = np.all((seeds_p > -margin) & (seeds_p < size_+margin),axis=1)
+                seeds_p,weights_p,ID = seeds_p[near],weights_p[near],ID[near]
+
+            w_max = np.max(weights_p)
+            tree = spatial.cKDTree(np.column_stack((seeds_p,np.sqrt(w_max-weights_p))))          # power distance as Euclidean distance in 4D
+            distance = np.empty(len(todo))
+            for chunk in range(0,len(todo),2**20):                                                  # bounded memory for large grids
+                block = todo[chunk:chunk+2**20]
+                coords_p = np.column_stack((coords[block],np.zeros(len(block))))
+                try:
+                    distance[chunk:chunk+2**20],closest = \
+                        tree.query(coords_p,workers = int(os.environ.get('OMP_NUM_THREADS',4)))
+                except TypeError:
+                    distance[chunk:chunk+2**20],closest = \
+                        tree.query(coords_p,n_jobs = int(os.environ.get('OMP_NUM_THREADS',4)))      # scipy <1.6
+                material_[block] = ID[closest]
+
+            if not periodic or margin >= np.max(size_): break
+            todo = todo[distance**2 - w_max > margin**2 - np.max(weights_[candidates])]              # closer image outside margin possible
+            margin *= 2.
+
+        material_ = material_.reshape(cells)
 
         return GeomGrid(material = material_ if material is None else np.array(material)[material_],
                         size     = size,
@@ -769,8 +933,15 @@ class GeomGrid:
             Compress with zlib algorithm. Defaults to True.
 
         """
+        if isinstance(self.material,np.memmap) or \
+           any(isinstance(ic,np.memmap) for ic in self.initial_conditions.values()):
+            _save_VTI(str(fname) if str(fname).endswith('.vti') else str(fname)+'.vti',
+                      self.size,self.origin,{'material':self.material,**self.initial_conditions},
+                      self.comments,compress)
+            return
+
         v = VTK.from_image_data(self.cells,self.size,self.origin)\
-               .set('material',self.material.flatten(order='F'))
+               .set('material',self.material.flatten(order='F').astype(_VTI_dtype(self.material)))
         for label,data in self.initial_conditions.items():
             v = v.set(label,data.flatten(order='F'))
         v.comments = self.comments
@@ -865,14 +1036,20 @@ class GeomGrid:
         offset_ = np.array(offset,np.int64) if offset is not None else np.zeros(3,np.int64)
         cells_ = np.array(cells,np.int64) if cells is not None else self.cells
 
-        canvas = np.full(cells_,np.nanmax(self.material) + 1 if fill is None else fill,self.material.dtype)
+        material = self.material
+        fill_ = np.nanmax(material).item() + 1 if fill is None else fill
+        canvas = _empty(cells_,_fitting_dtype(material.dtype,fill_),material)
+        for z in _slabs(cells_[0]*cells_[1],cells_[2]):
+            canvas[:,:,z] = fill_
 
         LL = np.clip( offset_,           0,np.minimum(self.cells,     cells_+offset_))
         UR = np.clip( offset_+cells_,    0,np.minimum(self.cells,     cells_+offset_))
         ll = np.clip(-offset_,           0,np.minimum(     cells_,self.cells-offset_))
         ur = np.clip(-offset_+self.cells,0,np.minimum(     cells_,self.cells-offset_))
 
-        canvas[ll[0]:ur[0],ll[1]:ur[1],ll[2]:ur[2]] = self.material[LL[0]:UR[0],LL[1]:UR[1],LL[2]:UR[2]]
+        for z in _slabs(cells_[0]*cells_[1],max(0,ur[2]-ll[2])):
+            canvas[ll[0]:ur[0],ll[1]:ur[1],ll[2]+z.start:ll[2]+z.stop] = \
+                material[LL[0]:UR[0],LL[1]:UR[1],LL[2]+z.start:LL[2]+z.stop]
 
         return GeomGrid(material = canvas,
                         size     = self.size/self.cells*np.asarray(canvas.shape),
@@ -934,14 +1111,13 @@ class GeomGrid:
             raise ValueError(f'invalid direction "{set(directions).difference(valid)}" specified')
 
         limits: Sequence[Optional[int]] = [None,None] if reflect else [-2,0]
-        mat = self.material.copy()
+        idx = [np.concatenate([np.arange(c),np.arange(c)[limits[0]:limits[1]:-1]]) if d in directions else
+               np.arange(c) for d,c in zip(['x','y','z'],self.cells)]
 
-        if 'x' in directions:
-            mat = np.concatenate([mat,mat[limits[0]:limits[1]:-1,:,:]],0)
-        if 'y' in directions:
-            mat = np.concatenate([mat,mat[:,limits[0]:limits[1]:-1,:]],1)
-        if 'z' in directions:
-            mat = np.concatenate([mat,mat[:,:,limits[0]:limits[1]:-1]],2)
+        material = self.material
+        mat = _empty([len(i) for i in idx],material.dtype,material)
+        for z in _slabs(mat.shape[0]*mat.shape[1],mat.shape[2]):
+            mat[:,:,z] = material[np.ix_(idx[0],idx[1],idx[2][z])]
 
         return GeomGrid(material = mat,
                         size     = self.size/self.cells*np.asarray(mat.shape),
@@ -1031,13 +1207,14 @@ class GeomGrid:
         True
 
         """
-        material = self.material
+        fill_ = np.nanmax(self.material).item() + 1 if fill is None else fill
+        material = self.material.astype(_fitting_dtype(self.material.dtype,fill_),copy=False)
         # These rotations are always applied in the reference coordinate system, i.e. (z,x,z) not (z,x',z'')
         # see https://www.cs.utexas.edu/~theshark/courses/cs354/lectures/cs354-14.pdf
         for angle,axes in zip(R.as_Euler_angles(degrees=True)[::-1], [(0,1),(1,2),(0,1)]):
             material_temp = ndimage.rotate(material,angle,axes,order=0,prefilter=False,
-                                           output=self.material.dtype,
-                                           cval=np.nanmax(self.material) + 1 if fill is None else fill)
+                                           output=material.dtype,
+                                           cval=fill_)
             # avoid scipy interpolation errors for rotations close to multiples of 90°
             material = material_temp if np.prod(material_temp.shape) != np.prod(material.shape) else \
                        np.rot90(material,k=np.rint(angle/90.).astype(np.int64),axes=axes)
@@ -1138,9 +1315,13 @@ class GeomGrid:
             Updated grid-based geometry.
 
         """
-        _,renumbered = np.unique(self.material,return_inverse=True)
+        material = self.material
+        unique = _unique(material)
+        renumbered = _empty(self.cells,_compact_dtype(0,len(unique)-1),material)
+        for z in _slabs(self.cells[0]*self.cells[1],self.cells[2]):
+            renumbered[:,:,z] = np.searchsorted(unique,material[:,:,z])
 
-        return GeomGrid(material = renumbered.reshape(self.cells),
+        return GeomGrid(material = renumbered,
                         size     = self.size,
                         origin   = self.origin,
                         initial_conditions = self.initial_conditions,
@@ -1167,10 +1348,16 @@ class GeomGrid:
             Updated grid-based geometry.
 
         """
-        material = self.material.copy()
-        for f,t in zip(from_material if isinstance(from_material,(Sequence,np.ndarray)) else [from_material],
-                       to_material if isinstance(to_material,(Sequence,np.ndarray)) else [to_material]): # ToDo Python 3.10 has strict mode for zip
-            material[self.material==f] = t
+        original_ = self.material
+        to_material_ = to_material if isinstance(to_material,(Sequence,np.ndarray)) else [to_material]
+        material = _empty(self.cells,_fitting_dtype(original_.dtype,*to_material_),original_)
+        for z in _slabs(self.cells[0]*self.cells[1],self.cells[2]):
+            original = original_[:,:,z]
+            substituted = original.astype(material.dtype)
+            for f,t in zip(from_material if isinstance(from_material,(Sequence,np.ndarray)) else [from_material],
+                           to_material_): # ToDo Python 3.10 has strict mode for zip
+                substituted[original==f] = t
+            material[:,:,z] = substituted
 
         return GeomGrid(material = material,
                         size     = self.size,
@@ -1190,12 +1377,17 @@ class GeomGrid:
             Updated grid-based geometry.
 
         """
-        a = self.material.flatten(order='F')
-        from_ma = pd.unique(a)
+        material = self.material
+        slabs = list(_slabs(self.cells[0]*self.cells[1],self.cells[2]))
+        from_ma = pd.unique(np.concatenate([pd.unique(material[:,:,z].flatten(order='F')) for z in slabs]))
         sort_idx = np.argsort(from_ma)
-        ma = np.unique(a)[sort_idx][np.searchsorted(from_ma,a,sorter = sort_idx)]
+        to_ma = np.sort(from_ma)[sort_idx]
+
+        ma = _empty(self.cells,material.dtype,material)
+        for z in slabs:
+            ma[:,:,z] = to_ma[np.searchsorted(from_ma,material[:,:,z],sorter = sort_idx)]
 
-        return GeomGrid(material = ma.reshape(self.cells,order='F'),
+        return GeomGrid(material = ma,
                         size     = self.size,
                         origin   = self.origin,
                         initial_conditions = self.initial_conditions,
@@ -1237,32 +1429,38 @@ class GeomGrid:
         If multiple material IDs are most frequent within a stencil, a random choice is taken.
 
         """
-        def most_frequent(stencil: np.ndarray,
-                          selection: Union[None,np.ndarray],
-                          rng: np.random.Generator):
-            me = stencil[stencil.size//2]
-            if selection is None or me in selection:
-                unique, counts = np.unique(stencil,return_counts=True)
-                return rng.choice(unique[counts==np.max(counts)])
-            else:
-                return me
-
         rng = np.random.default_rng(rng_seed)
 
         d = np.floor(distance).astype(np.int64)
         ext = np.linspace(-d,d,1+2*d,dtype=float),
         xx,yy,zz = np.meshgrid(ext,ext,ext)
         footprint = xx**2+yy**2+zz**2 <= distance**2+distance*1e-8
+        material = self.material.copy()
         selection_ = None if selection is None else \
-                     np.setdiff1d(self.material,selection) if invert_selection else \
-                     np.intersect1d(self.material,selection)
-        material = ndimage.generic_filter(
-                                          self.material,
-                                          most_frequent,
-                                          footprint=footprint,
-                                          mode='wrap' if periodic else 'nearest',
-                                          extra_keywords=dict(selection=selection_,rng=rng),
-                                         ).astype(self.material.dtype)
+                     np.setdiff1d(material,selection) if invert_selection else \
+                     np.intersect1d(material,selection)
+
+        offsets = np.argwhere(footprint)
+        padded = np.pad(material,d,mode='wrap' if periodic else 'edge')
+        N_slab = max(1,2**22//(len(offsets)*self.cells[1]*self.cells[2]))                           # bounded memory for stencils
+        for x in range(0,self.cells[0],N_slab):
+            slab = material[x:x+N_slab]
+            me = slab.flatten()
+            active = np.ones(len(me),bool) if selection_ is None else np.isin(me,selection_)
+            stencils = np.stack([padded[x+i:x+i+slab.shape[0],j:j+self.cells[1],k:k+self.cells[2]]
+                                 for i,j,k in offsets],axis=-1).reshape(-1,len(offsets))[active]
+
+            stencils.sort(axis=1)
+            idx = np.arange(stencils.shape[1])
+            first = np.maximum.accumulate(np.where(np.diff(stencils,axis=1,prepend=stencils[:,:1]-1) != 0,idx,0),axis=1)
+            frequent = idx-first == np.max(idx-first,axis=1,keepdims=True)                          # last occurrence of most frequent IDs
+            most_frequent = stencils[np.arange(len(stencils)),np.argmax(frequent,axis=1)]
+            for t in np.flatnonzero(np.count_nonzero(frequent,axis=1) > 1):                         # ties, in order of generic_filter
+                most_frequent[t] = rng.choice(stencils[t,frequent[t]])
+
+            me[active] = most_frequent
+            slab[...] = me.reshape(slab.shape)
+
         return GeomGrid(material = material,
                         size     = self.size,
                         origin   = self.origin,
@@ -1354,9 +1552,10 @@ class GeomGrid:
         if periodic:                                                                                # translate back to center
             mask = np.roll(mask,((c/self.size-0.5)*self.cells).round().astype(np.int64),(0,1,2))
 
+        fill_ = np.nanmax(self.material).item()+1 if fill is None else fill
         return GeomGrid(material = np.where(np.logical_not(mask) if inverse else mask,
-                                        self.material,
-                                        np.nanmax(self.material)+1 if fill is None else fill),
+                                            self.material,
+                                            np.array(fill_,_fitting_dtype(self.material.dtype,fill_))),
                         size     = self.size,
                         origin   = self.origin,
                         initial_conditions = self.initial_conditions,
@@ -1399,35 +1598,37 @@ class GeomGrid:
             Updated grid-based geometry.
 
         """
-        @numba_njit_wrapper()
-        def tainted_neighborhood(stencil: np.ndarray,
-                                 selection: Optional[np.ndarray] = None):
-            me = stencil[stencil.size//2]
-            if selection is None:
-                return np.any(stencil != me)
-            elif not len(selection)==0:
-                for stencil_item in stencil:
-                    for selection_item in selection:
-                        if stencil_item==selection_item and selection_item!=me:
-                            return True
-            return False
         d = np.floor(distance).astype(np.int64)
         ext = np.linspace(-d,d,1+2*d,dtype=float),
         xx,yy,zz = np.meshgrid(ext,ext,ext)
         footprint = xx**2+yy**2+zz**2 <= distance**2+distance*1e-8
-        offset_ = np.nanmax(self.material)+1 if offset is None else offset
+        material = self.material
+        offset_ = np.nanmax(material).item()+1 if offset is None else offset
         selection_ = None if selection is None else \
-                     np.setdiff1d(self.material,selection) if invert_selection else \
-                     np.intersect1d(self.material,selection)
-
-        mask = ndimage.generic_filter(self.material,
-                                      tainted_neighborhood,
-                                      footprint=footprint,
-                                      mode='wrap' if periodic else 'nearest',
-                                      extra_keywords=dict(selection=selection_),
-                                     )
-
-        return GeomGrid(material = np.where(mask, self.material + offset_,self.material),
+                     np.setdiff1d(material,selection) if invert_selection else \
+                     np.intersect1d(material,selection)
+
+        offsets = np.argwhere(footprint)
+        padded = np.pad(material,d,mode='wrap' if periodic else 'edge')
+        if selection_ is None:
+            mask = np.zeros(self.cells,bool)
+            for i,j,k in offsets:
+                mask |= padded[i:i+self.cells[0],j:j+self.cells[1],k:k+self.cells[2]] != material
+        else:
+            selected = np.isin(padded,selection_)
+            mask = ndimage.binary_dilation(selected,footprint)[d:d+self.cells[0],d:d+self.cells[1],d:d+self.cells[2]]
+            own = mask & np.isin(material,selection_)
+            if np.any(own):                                                                         # selected neighbor needs to differ
+                differs = np.zeros(self.cells,bool)
+                for i,j,k in offsets:
+                    neighbor = (slice(i,i+self.cells[0]),slice(j,j+self.cells[1]),slice(k,k+self.cells[2]))
+                    differs |= selected[neighbor] & (padded[neighbor] != material)
+                mask &= ~own | differs
+
+        material = material.astype(_fitting_dtype(material.dtype,
+                                                  np.nanmin(material).item()+offset_,
+                                                  np.nanmax(material).item()+offset_),copy=False)
+        return GeomGrid(material = np.where(mask, material + offset_,material),
                         size     = self.size,
                         origin   = self.origin,
                         initial_conditions = self.initial_conditions,
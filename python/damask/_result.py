@@ -1,22 +1,30 @@
 import re
 import fnmatch
 import os
-import copy
+import json
+import time
 import datetime
 import xml.etree.ElementTree as ET                                                                  # noqa
 import xml.dom.minidom
 import functools
+import contextlib
+import concurrent.futures
+import multiprocessing as mp
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Iterable
-from typing import Optional, Union, Callable, Any, Sequence, Literal, Dict, List, Tuple
+from typing import Optional, Union, Callable, Any, Sequence, Literal, Dict, List, Tuple, Set, Deque, Generator
 
 import h5py
 import numpy as np
 from numpy import ma
+import scipy.fft
+from vtkmodules.vtkCommonDataModel import vtkImageData, vtkPolyData, vtkUnstructuredGrid
+from vtkmodules.util.numpy_support import vtk_to_numpy
 
 import damask
 from . import VTK
+from . import Table
 from . import Orientation
 from . import Rotation
 from . import grid_filters
@@ -28,13 +36,19 @@ from ._typehints import FloatSequence, IntSequence, DADF5Dataset
 h5py3 = h5py.__version__[0] == '3'
 
 chunk_size = 1024**2//8                                                                             # for compression in HDF5
+batch_size = 64*1024**2                                                                             # input of batched spatial derivatives
 prefix_inc = 'increment_'
 
-def _read(dataset: h5py._hl.dataset.Dataset) -> np.ndarray:
-    """Read a dataset and its metadata into a numpy.ndarray."""
+def _dtype(dataset: h5py._hl.dataset.Dataset) -> np.dtype:
+    """Data type of a dataset with its attributes as metadata."""
     metadata = {k:(v.decode() if not h5py3 and type(v) is bytes else v) for k,v in dataset.attrs.items()}
-    dtype = np.dtype(dataset.dtype,metadata=metadata)                                               # type: ignore
-    return np.array(dataset,dtype=dtype)
+    return np.dtype(dataset.dtype,metadata=metadata)                                                # type: ignore
+
+def _read(dataset: h5py._hl.dataset.Dataset,
+          entries: Optional[np.ndarray] = None) -> np.ndarray:
+    """Read a dataset (or selected entries of it) and its metadata into a numpy.ndarray."""
+    return np.array(dataset,dtype=_dtype(dataset)) if entries is None else \
+           _read_entries(dataset,entries).view(_dtype(dataset))
 
 def _match(requested,
            existing: h5py._hl.base.KeysViewHDF5) -> List[str]:
@@ -53,6 +67,59 @@ def _match(requested,
     return sorted(set(flatten_list([fnmatch.filter(existing,r) for r in requested_])),
                   key=util.natural_sort)
 
+def _group_by_label(label: np.ndarray,
+                    entry: np.ndarray) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """Group cell indices and data entries of a 'cell_to' mapping by label."""
+    labels,inverse,counts = np.unique(label,return_inverse=True,return_counts=True)
+    at_cell = np.argsort(inverse.ravel(),kind='stable').astype(np.min_scalar_type(max(len(label)-1,0)))
+    in_data = entry[at_cell].astype(np.min_scalar_type(max(np.max(entry,initial=0),0)))
+    splits = np.cumsum(counts)[:-1]
+    return {l:(a,d) for l,a,d in zip(labels,np.split(at_cell,splits),np.split(in_data,splits))}
+
+def _select(at_cell: np.ndarray,
+            in_data: np.ndarray,
+            cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find cells located in a dataset and the (sorted, unique) entries to read for them."""
+    if len(at_cell) == 0:
+        return np.zeros(len(cells),bool),np.empty(0,np.intp),np.empty(0,np.intp)
+    i = np.minimum(np.searchsorted(at_cell,cells),len(at_cell)-1)                                   # at_cell is sorted
+    found = at_cell[i] == cells
+    entries,inverse = np.unique(in_data[i[found]],return_inverse=True)
+    return found,entries,inverse.ravel()
+
+def _read_entries(dataset: h5py._hl.dataset.Dataset,
+                  entries: np.ndarray) -> np.ndarray:
+    """Read selected (sorted, unique) entries of a dataset."""
+    if len(entries) == 0:
+        return np.empty((0,)+dataset.shape[1:],dataset.dtype)
+    elif len(entries) > 1 and entries[-1]-entries[0] >= 4*len(entries):                              # sparse selection
+        return dataset[entries]
+    else:
+        return dataset[entries[0]:entries[-1]+1][entries-entries[0]]
+
+def _compact(in_data: Dict[str, np.ndarray]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Find the (sorted, unique) entries required by several mappings and their positions among them."""
+    entries = np.unique(np.concatenate([np.empty(0,np.intp)]+list(in_data.values())))
+    return entries,{k:np.searchsorted(entries,v) for k,v in in_data.items()}
+
+def _box_indices(start: np.ndarray,
+                 cells: np.ndarray,
+                 dims: np.ndarray) -> np.ndarray:
+    """Flat (Fortran order) indices of a box in a grid."""
+    idx = np.meshgrid(*[np.arange(s,s+c) for s,c in zip(start,cells)],indexing='ij')
+    return np.ravel_multi_index(tuple(idx),tuple(dims),order='F').ravel(order='F')
+
+def _iter_chunks(dataset: h5py._hl.dataset.Dataset,
+                 entries: Optional[np.ndarray] = None,
+                 N_bytes: Optional[int] = None):
+    """Iterate over (selected entries of) a dataset in slices aligned with the HDF5 chunk layout."""
+    N_rows = dataset.shape[0] if entries is None else len(entries)
+    bytes_per_row = max(1,dataset.dtype.itemsize*int(np.prod(dataset.shape[1:])))
+    alignment = 1 if dataset.chunks is None else dataset.chunks[0]
+    N = max(1,(chunk_size*8 if N_bytes is None else N_bytes)//bytes_per_row//alignment)*alignment
+    for s in range(0,N_rows,N):
+        yield dataset[s:s+N] if entries is None else _read_entries(dataset,entries[s:s+N])
+
 def _empty_like(dataset: np.ma.core.MaskedArray,
                 N_materialpoints: int,
                 fill_float: float,
@@ -63,6 +130,346 @@ def _empty_like(dataset: np.ma.core.MaskedArray,
                     mask = True)
 
 
+class _LazyDataset:
+    """Lazy, read-only access to a dataset in a DADF5 file."""
+
+    def __init__(self,
+                 fname: Path,
+                 path: str,
+                 shape: Tuple[int, ...],
+                 chunk_shape: Optional[Tuple[int, ...]] = None,
+                 entries: Optional[np.ndarray] = None):
+        self.fname = fname
+        self.path = path
+        self.entries = entries
+        self.shape = shape if entries is None else (len(entries),)+shape[1:]
+        self._N_chunk = chunk_size//max(1,int(np.prod(shape[1:]))) if chunk_shape is None else chunk_shape[0]
+
+    def __repr__(self) -> str:
+        """Return repr(self)."""
+        return f'{self.__class__.__name__}("{self.path}", shape={self.shape})'
+
+    def __len__(self) -> int:
+        """Return len(self)."""
+        return self.shape[0]
+
+    def __array__(self, dtype = None, copy = None) -> np.ndarray:
+        """Read all data."""
+        return np.asarray(self[()] if self.shape == () else self[:],dtype)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type including metadata."""
+        with h5py.File(self.fname,'r') as f:
+            return _dtype(f[self.path])
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        """Metadata."""
+        return dict(self.dtype.metadata)                                                            # type: ignore
+
+    def _split(self, key) -> Tuple[np.ndarray, tuple]:
+        """Split key into the (sorted, unique) rows to read and the key to apply to them in memory."""
+        key_ = key if isinstance(key,tuple) else (key,)
+        N_axes = sum(np.ndim(k) if isinstance(k,np.ndarray) and k.dtype == bool else 1
+                     for k in key_ if k is not None and k is not Ellipsis)
+        if len(key_) == 0 or key_[0] is Ellipsis and N_axes < len(self.shape):
+            return np.arange(len(self)),(slice(None),)+key_
+        if key_[0] is Ellipsis:
+            key_ = key_[1:]
+        if key_[0] is None or np.ndim(key_[0]) > 1 and np.asarray(key_[0]).dtype == bool:
+            return np.arange(len(self)),key_                                                        # read all
+
+        rows = np.arange(len(self))[key_[0]]
+        if isinstance(key_[0],slice):
+            increasing = key_[0].step is None or key_[0].step > 0
+            return (rows if increasing else rows[::-1]),(slice(None) if increasing else slice(None,None,-1),)+key_[1:]
+        unique,inverse = np.unique(rows,return_inverse=True)
+        return unique,((int(inverse[0]) if np.ndim(rows) == 0 else inverse.reshape(np.shape(rows))),)+key_[1:]
+
+    def __getitem__(self, key) -> np.ndarray:
+        """Read the selected hyperslab."""
+        with h5py.File(self.fname,'r') as f:
+            if self.shape == ():
+                return np.asarray(f[self.path][key],dtype=_dtype(f[self.path]))
+            rows,key_ = self._split(key)
+            if self.entries is None:
+                data = _read(f[self.path],rows)
+            else:
+                entries,inverse = np.unique(self.entries[rows],return_inverse=True)
+                data = _read(f[self.path],entries)[inverse.ravel()]
+            return data[key_]
+
+    def chunks(self, N: Optional[int] = None):
+        """
+        Iterate over the data in slices along the first axis.
+
+        Parameters
+        ----------
+        N : int, optional
+            Number of entries per slice.
+            Defaults to None, in which case the HDF5 chunk size is used.
+
+        """
+        N_ = self._N_chunk if N is None else N
+        for s in range(0,len(self),N_):
+            yield self[s:s+N_]
+
+
+class _LazyPlacedDataset(_LazyDataset):
+    """Lazy, read-only access to data in spatial order that is distributed over DADF5 groups."""
+
+    def __init__(self,
+                 fname: Path,
+                 path: str,
+                 shape: Tuple[int, ...],
+                 template: str,
+                 fill_float: float,
+                 fill_int: int):
+        super().__init__(fname,path,shape)
+        self.template = template
+        self.fill_float = fill_float
+        self.fill_int = fill_int
+        self.sources: List[Tuple[str, np.ndarray, np.ndarray]] = []
+
+    def add_source(self,
+                   path: str,
+                   at_cell: np.ndarray,
+                   in_data: np.ndarray):
+        """Add a dataset of which the entries in_data are located at_cell."""
+        self.sources.append((path,at_cell,in_data))
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type including metadata."""
+        with h5py.File(self.fname,'r') as f:
+            return _dtype(f[self.template])
+
+    def __getitem__(self, key) -> np.ma.core.MaskedArray:
+        """Read data of the selected cells."""
+        cells,key_ = self._split(key)
+
+        with h5py.File(self.fname,'r') as f:
+            dtype = _dtype(f[self.template])
+            data = ma.array(np.empty((len(cells),)+self.shape[1:],dtype),
+                            fill_value = self.fill_float if np.issubdtype(dtype,np.floating) else self.fill_int,
+                            mask = True)
+            for path,at_cell,in_data in self.sources:
+                found,entries,inverse = _select(at_cell,in_data,cells)
+                if len(entries) > 0:
+                    data[found] = _read_entries(f[path],entries)[inverse]
+
+        return data[key_]
+
+
+class _Accumulator:
+    """One-pass accumulation of descriptive statistics (Welford/Chan et al.)."""
+
+    def __init__(self,
+                 edges: Optional[np.ndarray] = None):
+        self.N = 0
+        self.mean: Any = np.nan
+        self.M2: Any = np.nan
+        self.min: Any = np.nan
+        self.max: Any = np.nan
+        self.edges = edges
+        self.hist = None if edges is None else np.zeros(len(edges)-1,np.int64)
+
+    def add(self, data: np.ndarray):
+        """Add data (first axis) to the statistics."""
+        if (N := len(data)) == 0: return
+        data = data.astype(np.float64)
+        mean = np.mean(data,axis=0)
+        M2 = np.sum((data-mean)**2,axis=0)
+        if self.N == 0:
+            self.mean,self.M2 = mean,M2
+            self.min,self.max = np.min(data,axis=0),np.max(data,axis=0)
+        else:
+            delta = mean - self.mean
+            self.mean = self.mean + delta*N/(self.N+N)
+            self.M2 = self.M2 + M2 + delta**2*self.N*N/(self.N+N)
+            self.min,self.max = np.minimum(self.min,np.min(data,axis=0)),np.maximum(self.max,np.max(data,axis=0))
+        if self.hist is not None and self.edges is not None:
+            self.hist += np.histogram(data,self.edges)[0]
+        self.N += N
+
+    @property
+    def std(self):
+        """Standard deviation (population)."""
+        return np.sqrt(self.M2/self.N) if self.N > 0 else np.nan
+
+
+def _created(dataset: h5py._hl.dataset.Dataset) -> Optional[datetime.datetime]:
+    """Creation time of a dataset."""
+    if 'created' not in dataset.attrs: return None
+    created = dataset.attrs['created'] if h5py3 else dataset.attrs['created'].decode()
+    return datetime.datetime.strptime(created,'%Y-%m-%d %H:%M:%S%z')
+
+
+def _open_unlocked(fname: Path) -> h5py.File:
+    """Open HDF5 file for reading without locking to not block a writing process."""
+    try:
+        return h5py.File(fname,'r',locking=False)
+    except TypeError:                                                                               # h5py < 3.5
+        return h5py.File(fname,'r')
+
+
+def _signature(fname: Path) -> List[int]:
+    """Modification time and size of a file to detect changes."""
+    stat = os.stat(fname)
+    return [stat.st_mtime_ns,stat.st_size]
+
+
+def _read_metadata(f: h5py.File) -> Dict[str, Any]:
+    """Collect the metadata of all increments of a DADF5 file."""
+    def attr(obj: Union[h5py.File, h5py.Dataset], key: str) -> str:
+        return obj.attrs[key] if h5py3 else obj.attrs[key].decode()
+
+    r = re.compile(rf'{prefix_inc}([0-9]+)')
+    increments = sorted([i for i in f.keys() if r.match(i)],key=util.natural_sort)
+
+    datasets: Dict[str, Any] = {}
+    for inc in increments:
+        datasets[inc] = {}
+        for ty in ['phase','homogenization']:
+            datasets[inc][ty] = {label: {field: {d: {'shape':       list(dataset.shape),
+                                                     'unit':        attr(dataset,'unit'),
+                                                     'description': attr(dataset,'description')}
+                                                 for d,dataset in f['/'.join([inc,ty,label,field])].items()}
+                                         for field in f['/'.join([inc,ty,label])].keys()}
+                                 for label in f['/'.join([inc,ty])].keys()}
+
+    return {'attrs':      {k:str(attr(f,k)) for k in ['creator','created','call'] if k in f.attrs},
+            'increments': increments,
+            'times':      [float(f[inc].attrs['t/s']) for inc in increments],
+            'datasets':   datasets}
+
+
+def _storage_policy(storage: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Complete and validate storage policy for datasets."""
+    policy: Dict[str, Any] = {'compression':'gzip','level':6,'chunk_size':chunk_size*8,'checksum':True,
+                              'dtype':None}
+    if storage is not None:
+        if invalid := set(storage) - set(policy):
+            raise KeyError(f'invalid storage option(s) {", ".join(sorted(invalid))}')
+        policy.update(storage)
+
+    if policy['compression'] not in ['gzip','lzf',None]:
+        raise ValueError(f'invalid compression "{policy["compression"]}"')
+    if not 0 <= policy['level'] <= 9:
+        raise ValueError(f'invalid compression level "{policy["level"]}"')
+    if policy['chunk_size'] <= 0:
+        raise ValueError(f'invalid chunk size "{policy["chunk_size"]}"')
+    if policy['dtype'] is not None and np.dtype(policy['dtype']).kind != 'f':
+        raise ValueError(f'invalid floating point type "{policy["dtype"]}"')
+    return policy
+
+
+def _storage_dtype(policy: Dict[str, Any],
+                   dtype: np.dtype) -> np.dtype:
+    """Data type for storing data of given type according to storage policy."""
+    if policy['dtype'] is None or np.dtype(dtype).kind != 'f' \
+       or np.dtype(policy['dtype']).itemsize >= np.dtype(dtype).itemsize:
+        return np.dtype(dtype)
+    return np.dtype(policy['dtype'])
+
+
+def _storage_options(policy: Dict[str, Any],
+                     shape: Tuple[int, ...],
+                     dtype: np.dtype) -> Dict[str, Any]:
+    """Keyword arguments of h5py.Group.create_dataset for given storage policy."""
+    bytes_per_row = np.dtype(dtype).itemsize*int(np.prod(shape[1:]))
+    if chunked := shape[0]*bytes_per_row >= policy['chunk_size']*2:
+        chunks = (max(1,policy['chunk_size']//bytes_per_row),)+shape[1:]
+    else:
+        chunks = shape
+    compress = chunked and policy['compression'] is not None
+    return {'chunks':           chunks,
+            'compression':      policy['compression'] if compress else None,
+            'compression_opts': policy['level'] if compress and policy['compression'] == 'gzip' else None,
+            'shuffle':          compress,
+            'fletcher32':       policy['checksum']}
+
+
+def _runs(at_cell: np.ndarray,
+          in_data: np.ndarray) -> np.ndarray:
+    """Start in cell, start in data, and length of runs that are contiguous in both."""
+    breaks = np.flatnonzero((np.diff(at_cell) != 1) | (np.diff(in_data) != 1)) + 1
+    starts = np.concatenate(([0],breaks))
+    return np.column_stack((at_cell[starts],in_data[starts],np.diff(np.append(starts,len(at_cell)))))
+
+
+def _VTKHDF_geometry(g: h5py.Group,
+                     v: VTK):
+    """Write geometry and topology of VTK to VTKHDF group."""
+    data = v.vtk_data
+    if isinstance(data,vtkImageData):
+        g.attrs['Type'] = np.bytes_('ImageData')
+        g.attrs['WholeExtent'] = np.array(data.GetExtent(),np.int64)
+        g.attrs['Origin'] = np.array(data.GetOrigin())
+        g.attrs['Spacing'] = np.array(data.GetSpacing())
+        g.attrs['Direction'] = np.eye(3).flatten()
+    elif isinstance(data,(vtkPolyData,vtkUnstructuredGrid)):
+        if isinstance(data,vtkPolyData):
+            cells = data.GetVerts()
+            types = np.ones(v.N_cells,np.uint8)                                                     # VTK_VERTEX
+        else:
+            cells = data.GetCells()
+            types = vtk_to_numpy(data.GetCellTypesArray())
+        connectivity = vtk_to_numpy(cells.GetConnectivityArray())
+
+        g.attrs['Type'] = np.bytes_('UnstructuredGrid')
+        g.create_dataset('NumberOfPoints',data=[v.N_points])
+        g.create_dataset('NumberOfCells',data=[v.N_cells])
+        g.create_dataset('NumberOfConnectivityIds',data=[len(connectivity)])
+        g.create_dataset('Points',data=vtk_to_numpy(data.GetPoints().GetData()))
+        g.create_dataset('Connectivity',data=connectivity)
+        g.create_dataset('Offsets',data=vtk_to_numpy(cells.GetOffsetsArray()))
+        g.create_dataset('Types',data=types)
+    else:
+        raise TypeError(f'unsupported VTK type "{data.GetClassName()}"')
+
+
+class _WriterPool:
+    """Bounded pool of background processes that write VTK files."""
+
+    def __init__(self, N_processes: int):
+        self.N_processes = N_processes
+        self.running: deque = deque()
+
+    def __enter__(self) -> "_WriterPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.join(raise_errors=exc_info[0] is None)
+
+    def submit(self,
+               v: VTK,
+               fname: Path):
+        """Write in a background process, wait if the pool is exhausted."""
+        if self.N_processes > 0:
+            try:
+                writer = mp.Process(target=v.save,args=(fname,),kwargs={'parallel':False})
+                writer.start()
+                self.running.append((fname,writer))
+                self.join(self.N_processes-1)
+                return
+            except TypeError:                                                                       # no fork available
+                pass
+        v.save(fname,parallel=False)
+
+    def join(self,
+             N_max: int = 0,
+             raise_errors: bool = True):
+        """Wait until at most N_max processes are running."""
+        while len(self.running) > N_max:
+            fname,writer = self.running.popleft()
+            writer.join()
+            if writer.exitcode != 0 and raise_errors:
+                self.join(raise_errors=False)
+                raise OSError(f'could not write "{fname}"')
+
+
 class Result:
     """
     Add data to and export data from a DADF5 (DAMASK HDF5) file.
@@ -91,7 +498,12 @@ class Result:
 
     """
 
-    def __init__(self, fname: Union[str, Path]):
+    def __init__(self,
+                 fname: Union[str, Path],
+                 workers: Optional[int] = None,
+                 chunk_budget: Optional[int] = None,
+                 storage: Optional[Dict[str, Any]] = None,
+                 index: bool = False):
         """
         New result view bound to a DADF5 file.
 
@@ -99,8 +511,44 @@ class Result:
         ----------
         fname : str or pathlib.Path
             Name of the DADF5 file to be opened.
+        workers : int, optional
+            Number of worker threads used to calculate derived quantities
+            and to compute Fourier transforms for spatial derivatives,
+            and maximum number of processes writing VTK files in parallel.
+            Defaults to None, in which case the value of the environment
+            variable 'OMP_NUM_THREADS' (or 4 if unset) is used.
+        chunk_budget : int, optional
+            Maximum size in bytes of the input data that is read at once
+            per worker to calculate derived quantities. Larger DADF5 groups
+            are processed in slices aligned with the HDF5 chunk layout.
+            Defaults to None, in which case DADF5 groups are read completely
+            and spatial derivatives are calculated for batches of increments
+            with up to 64 MiB of input data.
+        storage : dict, optional
+            Storage policy for derived datasets. Valid keys are
+            'compression' ({'gzip', 'lzf', None}, defaults to 'gzip'),
+            'level' (compression level of gzip, defaults to 6),
+            'chunk_size' (target size of HDF5 chunks in bytes, defaults to 1 MiB),
+            'checksum' (Fletcher32 checksum, defaults to True),
+            and 'dtype' (floating point type, e.g. numpy.float32, to reduce
+            the precision of derived datasets to, defaults to None).
+            Only datasets of at least two chunks are compressed.
+            The original type of datasets with reduced precision is stored
+            in their attribute 'original_dtype'.
+        index : bool, optional
+            Maintain an index of the increments, times, and datasets
+            in the sidecar file '<name>.index.json' next to the DADF5 file.
+            Opening the DADF5 file and listing its content then does not
+            require to traverse all increments. The index is rebuilt if
+            modification time or size of the DADF5 file change.
+            Defaults to False.
 
         """
+        self.fname = Path(fname).expanduser().absolute()
+        self._storage = _storage_policy(storage)
+        self._pipeline: Optional[List[Tuple[Callable, Dict[str, str], Dict[str, Any], bool]]] = None # deferred calculations, spatial?
+        self._index: Optional[Dict[str, Any]] = {} if index else None                               # cache, shared among views
+
         with h5py.File(fname,'r') as f:
 
             self.version_major = f.attrs['DADF5_version_major']
@@ -116,13 +564,20 @@ class Result:
                 self.size   = f['geometry'].attrs['size']
                 self.origin = f['geometry'].attrs['origin']
 
-            r = re.compile(rf'{prefix_inc}([0-9]+)')
-            self.increments = sorted([i for i in f.keys() if r.match(i)],key=util.natural_sort)
-            self.times = np.around([f[i].attrs['t/s'] for i in self.increments],12)
+            if self._index is None:
+                r = re.compile(rf'{prefix_inc}([0-9]+)')
+                self.increments = sorted([i for i in f.keys() if r.match(i)],key=util.natural_sort)
+                self.times = np.around([f[i].attrs['t/s'] for i in self.increments],12)
+            else:
+                content = self._metadata()
+                self.increments = list(content['increments'])
+                self.times = np.around(content['times'],12)
             if len(self.increments) == 0:
                 raise ValueError('incomplete DADF5 file')
 
             self.N_materialpoints, self.N_constituents = np.shape(f['cell_to/phase'])
+            if self.structured:
+                self._grid = (self.cells,self.size,self.origin)                                     # complete grid
 
             self.homogenization  = f['cell_to/homogenization']['label'].astype('str')
             self.homogenizations = sorted(np.unique(self.homogenization),key=util.natural_sort)
@@ -130,10 +585,14 @@ class Result:
             self.phases          = sorted(np.unique(self.phase),key=util.natural_sort)
 
             self.fields: List[str] = []
+            groups = f if self._index is None else \
+                     {'/'.join([self.increments[0],ty,label]):fields
+                      for ty in ['phase','homogenization']
+                      for label,fields in content['datasets'][self.increments[0]][ty].items()}
             for c in self.phases:
-                self.fields += f['/'.join([self.increments[0],'phase',c])].keys()
+                self.fields += groups['/'.join([self.increments[0],'phase',c])].keys()
             for m in self.homogenizations:
-                self.fields += f['/'.join([self.increments[0],'homogenization',m])].keys()
+                self.fields += groups['/'.join([self.increments[0],'homogenization',m])].keys()
             self.fields = sorted(set(self.fields),key=util.natural_sort)                            # make unique
 
         self.visible = {'increments':      self.increments,
@@ -142,19 +601,32 @@ class Result:
                         'fields':          self.fields,
                        }
 
-        self.fname = Path(fname).expanduser().absolute()
+        for metadata in [self.times,self.homogenization,self.phase]:                               # shared among views
+            metadata.flags.writeable = False
 
         self._protected = True
+        self._incremental = False
+        self._region: Optional[Tuple[np.ndarray, np.ndarray]] = None                                # start of box, mask of full grid
+        self._cell_to: Dict[str, Any] = {}                                                          # cache, shared among views
+        self._workers = int(os.environ.get('OMP_NUM_THREADS',4)) if workers is None else workers
+        if self._workers < 1:
+            raise ValueError(f'invalid number of workers "{self._workers}"')
+        self._chunk_budget = chunk_budget
 
 
     def __copy__(self) -> "Result":
         """
-        Return deepcopy(self).
+        Return copy.copy(self).
 
-        Create deep copy.
+        Create copy with own view that shares the (immutable)
+        metadata of the DADF5 file, e.g. the spatial mappings.
 
         """
-        return copy.deepcopy(self)
+        dup = self.__class__.__new__(self.__class__)
+        dup.__dict__.update(self.__dict__)
+        dup.visible = {what:list(labels) for what,labels in self.visible.items()}
+        dup._pipeline = None
+        return dup
 
     copy = __copy__
 
@@ -166,10 +638,14 @@ class Result:
         Give short, human-readable summary.
 
         """
-        with h5py.File(self.fname,'r') as f:
-            header = [f'Created by {f.attrs["creator"]}',
-                      f'        on {f.attrs["created"]}',
-                      f' executing "{f.attrs["call"]}"']
+        if self._index is None:
+            with h5py.File(self.fname,'r') as f:
+                attrs = {k:f.attrs[k] for k in ['creator','created','call']}
+        else:
+            attrs = self._metadata()['attrs']
+        header = [f'Created by {attrs["creator"]}',
+                  f'        on {attrs["created"]}',
+                  f' executing "{attrs["call"]}"']
         visible_increments = self.visible['increments']
 
         first = self.view(increments=visible_increments[0:1]).list_data()
@@ -183,6 +659,45 @@ class Result:
         return util.srepr([util.deemph(header)] + first + in_between + last)
 
 
+    def _metadata(self) -> Dict[str, Any]:
+        """
+        Metadata of all increments.
+
+        Read from the sidecar index if it is up to date, otherwise
+        rebuild the index from the DADF5 file.
+
+        Returns
+        -------
+        metadata : dict
+            Attributes of the file as well as increments, times,
+            and shape, unit, and description of all datasets.
+
+        """
+        assert self._index is not None
+        signature = _signature(self.fname)
+        if self._index.get('signature') != signature:
+            fname_index = self.fname.with_suffix('.index.json')
+            try:
+                with open(fname_index) as f:
+                    index = json.load(f)
+            except (OSError,ValueError):
+                index = {}
+            if index.get('signature') != signature:
+                with h5py.File(self.fname,'r') as f:
+                    index = dict(_read_metadata(f),signature=signature)
+                try:
+                    fname_tmp = fname_index.with_name(f'.{fname_index.name}.{os.getpid()}')
+                    with open(fname_tmp,'w') as f:
+                        json.dump(index,f)
+                    os.replace(fname_tmp,fname_index)
+                except OSError:                                                                     # read-only location
+                    pass
+            self._index.clear()
+            self._index.update(index)
+
+        return self._index
+
+
     def _manage_view(self,
                      action: Literal['set', 'add', 'del'],
                      increments: Union[None, int, Sequence[int], str, Sequence[str], bool] = None,
@@ -305,7 +820,9 @@ class Result:
              phases: Union[None, str, Sequence[str], bool] = None,
              homogenizations: Union[None, str, Sequence[str], bool] = None,
              fields: Union[None, str, Sequence[str], bool] = None,
-             protected: Optional[bool] = None) -> "Result":
+             region: Union[None, bool, np.ndarray, Tuple[IntSequence, IntSequence]] = None,
+             protected: Optional[bool] = None,
+             incremental: Optional[bool] = None) -> "Result":
         """
         Set view.
 
@@ -324,8 +841,19 @@ class Result:
             Names of homogenizations to select.
         fields: (list of) str, or bool, optional.
             Names of fields to select.
+        region: numpy.ndarray of bool, pair of sequences of int, or bool, optional.
+            Spatial region of structured grids to select, given either as
+            mask of the cells or as start and end (exclusive) cell indices
+            of a box with respect to the complete grid.
+            True selects the complete grid.
         protected: bool, optional.
             Protection status of existing data.
+        incremental: bool, optional.
+            Only calculate derived datasets that are missing, incomplete, or
+            older than their input datasets. Outdated datasets are replaced
+            only if existing data is not protected. Datasets that were
+            calculated for a spatial region are extended by the selected
+            region.
 
         Returns
         -------
@@ -346,16 +874,71 @@ class Result:
         >>> r = damask.Result('my_file.hdf5')
         >>> r_t10to40 = r.view(times=r.times_in_range(10.0,40.0))
 
+        Get a view that shows only the cells within the box
+        spanned by cell (2,2,0) and cell (9,9,15):
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r_box = r.view(region=([2,2,0],[10,10,16]))
+
         """
         dup = self._manage_view('set',increments,times,phases,homogenizations,fields)
+        if region is not None:
+            dup._set_region(region)
         if protected is not None:
             if not protected:
                 print(util.warn('Warning: Modification of existing datasets allowed!'))
             dup._protected = protected
+        if incremental is not None:
+            dup._incremental = incremental
 
         return dup
 
 
+    def _set_region(self,
+                    region: Union[bool, np.ndarray, Tuple[IntSequence, IntSequence]]):
+        """
+        Restrict the view to a spatial region.
+
+        Parameters
+        ----------
+        region : numpy.ndarray of bool, pair of sequences of int, or bool
+            Mask of the cells or start and end (exclusive) cell indices
+            of a box. True selects the complete grid.
+
+        """
+        if not self.structured:
+            raise NotImplementedError('spatial region for unstructured results')
+
+        cells,size,origin = self._grid
+        if region is True:
+            self.cells,self.size,self.origin = cells,size,origin
+            self.N_materialpoints = int(np.prod(cells))
+            self._region = None
+            return
+        if region is False:
+            raise ValueError('empty region')
+
+        if isinstance(region,np.ndarray) and region.dtype == bool:
+            mask = region.reshape(cells,order='F')
+        else:
+            start,end = np.array(region[0],int),np.array(region[1],int)
+            if np.any(start < 0) or np.any(end > cells) or np.any(start >= end):
+                raise ValueError(f'invalid box "{start}" to "{end}"')
+            mask = np.zeros(cells,bool)
+            mask[start[0]:end[0],start[1]:end[1],start[2]:end[2]] = True
+
+        if not np.any(mask):
+            raise ValueError('empty region')
+        idx = np.nonzero(mask)
+        start = np.array([np.min(i) for i in idx])
+        self.cells  = np.array([np.max(i) for i in idx]) - start + 1
+        self.size   = size/cells*self.cells
+        self.origin = origin + size/cells*start
+        self.N_materialpoints = int(np.prod(self.cells))
+        self._region = (start,mask.reshape(-1,order='F'))
+
+
     def view_more(self,*,
                   increments: Union[None, int, Sequence[int], str, Sequence[str], bool] = None,
                   times: Union[None, float, Sequence[float], str, Sequence[str], bool] = None,
@@ -528,6 +1111,9 @@ class Result:
             Line-formatted information about active datasets.
 
         """
+        if self._index is not None:
+            return self._list_metadata()
+
         msg = []
         with h5py.File(self.fname,'r') as f:
             for inc in self.visible['increments']:
@@ -549,6 +1135,24 @@ class Result:
         return msg
 
 
+    def _list_metadata(self) -> List[str]:
+        """Collect information on all active datasets from the index."""
+        datasets = self._metadata()['datasets']
+        msg = []
+        for inc in self.visible['increments']:
+            msg += [f'\n{inc} ({self.times[self.increments.index(inc)]} s)']
+            for ty in ['phase','homogenization']:
+                msg += [f'  {ty}']
+                for label in self.visible[ty+'s']:
+                    msg += [f'    {label}']
+                    for field in _match(self.visible['fields'],datasets[inc][ty][label].keys()):
+                        msg += [f'      {field}']
+                        for d,dataset in datasets[inc][ty][label][field].items():
+                            msg += [f'        {d} / {dataset["unit"]}: {dataset["description"]}']
+
+        return msg
+
+
     def enable_user_function(self,
                              func: Callable):
         globals()[func.__name__]=func
@@ -1311,13 +1915,15 @@ class Result:
 
         Notes
         -----
-        This function is implemented only for structured grids
-        with one constituent and a single phase.
+        This function is implemented only for structured grids.
+        The field needs to be defined in all cells, i.e. for all
+        phases or homogenizations, and is differentiated separately
+        for each constituent.
 
         """
         def curl(f: DADF5Dataset, size: np.ndarray) -> DADF5Dataset:
             return {
-                    'data':  grid_filters.curl(size,f['data']),
+                    'data':  grid_filters._curl(size,f['data'],batched=True),
                     'label': f"curl({f['label']})",
                     'meta':  {
                               'unit':        f['meta']['unit']+'/m',
@@ -1326,7 +1932,7 @@ class Result:
                               }
                      }
 
-        self._add_generic_grid(curl,{'f':f},{'size':self.size})
+        self._add_generic_grid(curl,{'f':f})
 
 
     def add_divergence(self, f: str):
@@ -1340,13 +1946,15 @@ class Result:
 
         Notes
         -----
-        This function is implemented only for structured grids
-        with one constituent and a single phase.
+        This function is implemented only for structured grids.
+        The field needs to be defined in all cells, i.e. for all
+        phases or homogenizations, and is differentiated separately
+        for each constituent.
 
         """
         def divergence(f: DADF5Dataset, size: np.ndarray) -> DADF5Dataset:
             return {
-                    'data':  grid_filters.divergence(size,f['data']),
+                    'data':  grid_filters._divergence(size,f['data'],batched=True),
                     'label': f"divergence({f['label']})",
                     'meta':  {
                               'unit':        f['meta']['unit']+'/m',
@@ -1355,7 +1963,7 @@ class Result:
                               }
                      }
 
-        self._add_generic_grid(divergence,{'f':f},{'size':self.size})
+        self._add_generic_grid(divergence,{'f':f})
 
 
     def add_gradient(self, f: str):
@@ -1369,14 +1977,17 @@ class Result:
 
         Notes
         -----
-        This function is implemented only for structured grids
-        with one constituent and a single phase.
+        This function is implemented only for structured grids.
+        The field needs to be defined in all cells, i.e. for all
+        phases or homogenizations, and is differentiated separately
+        for each constituent.
 
         """
         def gradient(f: DADF5Dataset, size: np.ndarray) -> DADF5Dataset:
             return {
-                    'data':  grid_filters.gradient(size,f['data'] if len(f['data'].shape) == 4 else \
-                                                        f['data'].reshape(f['data'].shape+(1,))),
+                    'data':  grid_filters._gradient(size,f['data'] if len(f['data'].shape) == 5 else \
+                                                         f['data'].reshape(f['data'].shape+(1,)),
+                                                    batched=True),
                     'label': f"gradient({f['label']})",
                     'meta':  {
                               'unit':        f['meta']['unit']+'/m',
@@ -1385,7 +1996,7 @@ class Result:
                               }
                      }
 
-        self._add_generic_grid(gradient,{'f':f},{'size':self.size})
+        self._add_generic_grid(gradient,{'f':f})
 
 
     def _add_generic_grid(self,
@@ -1405,48 +2016,154 @@ class Result:
             Details of the datasets to be used:
             {arg (name to which the data is passed in func): label (in DADF5 file)}.
         args : dictionary, optional
-            Arguments parsed to func.
+            Arguments parsed to func in addition to the physical size of the grid ('size').
 
         """
-        if self.N_constituents != 1 or len(datasets) != 1 or not self.structured:
-            raise NotImplementedError('not a structured grid with one constituent and a single phase')
+        if len(datasets) != 1 or not self.structured:
+            raise NotImplementedError('not a structured grid')
+        if self._region is not None:
+            raise NotImplementedError('spatial derivatives for a spatial region')
+        if self._pipeline is not None:
+            self._pipeline.append((func,datasets,args,True))
+            return
 
-        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
+        label = list(datasets.values())[0]
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self.view(phases=True,homogenizations=True)._mappings()
+        mappings = {'phase':          [(at_cell_ph[c],in_data_ph[c]) for c in range(self.N_constituents)],
+                    'homogenization': [(at_cell_ho,in_data_ho)]}
+        groups = {'phase':self.phases,'homogenization':self.homogenizations}
+
+        def assemble(f: h5py.File,
+                     inc: str,
+                     ty: str,
+                     field: str) -> Optional[np.ndarray]:
+            """Place data of all groups into the full grid, one per constituent."""
+            grids: Optional[np.ndarray] = None
+            for x in groups[ty]:
+                if all(len(at_cell[x]) == 0 for at_cell,_ in mappings[ty]): continue
+                path = '/'.join([inc,ty,x,field,label])
+                if path not in f: return None
+                data = _read(f[path])
+                if grids is None:
+                    grids = np.empty((len(mappings[ty]),self.N_materialpoints)+data.shape[1:],data.dtype)
+                    covered = np.zeros((len(mappings[ty]),self.N_materialpoints),bool)
+                for c,(at_cell,in_data) in enumerate(mappings[ty]):
+                    grids[c,at_cell[x]] = data[in_data[x]]
+                    covered[c,at_cell[x]] = True
+            return grids if grids is not None and np.all(covered) else None
+
+        with h5py.File(self.fname, 'a') as f, scipy.fft.set_workers(self._workers):
+            found = False
+            for ty in ['phase','homogenization']:
+                fields = set()
+                for inc in self.visible['increments']:
+                    for x in self.visible[ty+'s']:
+                        fields |= {field for field in _match(self.visible['fields'],f['/'.join([inc,ty,x])].keys())
+                                   if label in f['/'.join([inc,ty,x,field])].keys()}
+                for field in sorted(fields,key=util.natural_sort):
+                    found = True
+                    incs = [inc for inc in self.visible['increments']
+                            if any('/'.join([inc,ty,x,field,label]) in f for x in self.visible[ty+'s'])]
+                    sample = next(f['/'.join([incs[0],ty,x,field,label])] for x in self.visible[ty+'s']
+                                  if '/'.join([incs[0],ty,x,field,label]) in f)
+                    dtype = _storage_dtype(self._storage,sample.dtype)
+                    N_batch = max(1,(batch_size if self._chunk_budget is None else self._chunk_budget)
+                                    //(self.N_materialpoints*len(mappings[ty])*int(np.prod(sample.shape[1:]))*dtype.itemsize))
+                    for first in range(0,len(incs),N_batch):
+                        assembled = [(inc,assemble(f,inc,ty,field)) for inc in incs[first:first+N_batch]]
+                        for inc in [inc for inc,grids in assembled if grids is None]:
+                            print(f'Dataset {label} of {ty}/{field} not defined in all cells of {inc}, '
+                                  'no derivative was added.')
+                        batch = [(inc,grids) for inc,grids in assembled if grids is not None]
+                        if not batch: continue
+
+                        grids_ = batch[0][1]
+                        data = np.stack([np.reshape(grid.astype(dtype,copy=False),tuple(self.cells)+grid.shape[1:])
+                                         for _,grids in batch for grid in grids],axis=3)            # one transform for all increments and constituents
+                        r = func(f={'data':data,'label':label,'meta':grids_.dtype.metadata},size=self.size,**args)
+                        result = r['data'].reshape(r['data'].shape[:3]+(len(batch),len(grids_))+r['data'].shape[4:])
+
+                        for i,(inc,_) in enumerate(batch):
+                            for x in self.visible[ty+'s']:
+                                path = '/'.join([inc,ty,x,field])
+                                if '/'.join([path,label]) not in f: continue
+                                result1 = np.empty((f['/'.join([path,label])].shape[0],)+r['data'].shape[4:],
+                                                   r['data'].dtype)
+                                for c,(at_cell,in_data) in enumerate(mappings[ty]):
+                                    result1[in_data[x]] = result[:,:,:,i,c].reshape((-1,)+result1.shape[1:])[at_cell[x]]
+
+                                h5_dataset = f[path].create_dataset(r['label'],data=result1,dtype=dtype,
+                                                                    **_storage_options(self._storage,result1.shape,dtype))
+                                if dtype != grids_.dtype:
+                                    h5_dataset.attrs['original_dtype'] = str(grids_.dtype)
+
+                                now = datetime.datetime.now().astimezone()
+                                h5_dataset.attrs['created'] = now.strftime('%Y-%m-%d %H:%M:%S%z') if h5py3 else \
+                                                              now.strftime('%Y-%m-%d %H:%M:%S%z').encode()
+
+                                for l,v in r['meta'].items():
+                                    h5_dataset.attrs[l.lower()]=v.encode() if not h5py3 and type(v) is str else v
+                                creator = h5_dataset.attrs['creator'] if h5py3 else \
+                                          h5_dataset.attrs['creator'].decode()
+                                h5_dataset.attrs['creator'] = f'damask.Result.{creator} v{damask.version}' if h5py3 else \
+                                                              f'damask.Result.{creator} v{damask.version}'.encode()
+
+            if not found: raise RuntimeError('received invalid dataset')
+
+
+    @contextlib.contextmanager
+    def pipeline(self,
+                 keep: Union[None, str, List[str]] = None) -> Generator["Result", None, None]:
+        """
+        Fuse the calculation of derived quantities.
+
+        Quantities that are added within this context are calculated
+        together when leaving the context. The input datasets of each
+        DADF5 group are read only once and intermediate results are
+        passed in memory to subsequent calculations.
+        Spatial derivatives ('add_curl', 'add_divergence', 'add_gradient')
+        are calculated one after the other once the preceding quantities
+        are stored. They and the datasets required after them are stored
+        irrespective of 'keep'.
+        Views created within this context do not take part in the pipeline.
 
-        increments = self.place(list(datasets.values()),False)
-        if not increments: raise RuntimeError('received invalid dataset')
-        with h5py.File(self.fname, 'a') as f:
-            for increment in increments.items():
-                for ty in increment[1].items():
-                    for field in ty[1].items():
-                        d: np.ma.MaskedArray = list(field[1].values())[0]
-                        if np.any(d.mask): continue
-                        dataset = {'f':{'data':np.reshape(d.data,tuple(self.cells)+d.data.shape[1:]),
-                                        'label':list(datasets.values())[0],
-                                        'meta':d.data.dtype.metadata}}
-                        r = func(**dataset,**args)
-                        result = r['data'].reshape((-1,)+r['data'].shape[3:])
-                        for x in self.visible[ty[0]+'s']:
-                            if ty[0] == 'phase':
-                                result1 = result[at_cell_ph[0][x]]
-                            if ty[0] == 'homogenization':
-                                result1 = result[at_cell_ho[x]]
-
-                            path = '/'.join(['/',increment[0],ty[0],x,field[0]])
-                            h5_dataset = f[path].create_dataset(r['label'],data=result1)
-
-                            now = datetime.datetime.now().astimezone()
-                            h5_dataset.attrs['created'] = now.strftime('%Y-%m-%d %H:%M:%S%z') if h5py3 else \
-                                                          now.strftime('%Y-%m-%d %H:%M:%S%z').encode()
-
-                            for l,v in r['meta'].items():
-                                h5_dataset.attrs[l.lower()]=v.encode() if not h5py3 and type(v) is str else v
-                            creator = h5_dataset.attrs['creator'] if h5py3 else \
-                                      h5_dataset.attrs['creator'].decode()
-                            h5_dataset.attrs['creator'] = f'damask.Result.{creator} v{damask.version}' if h5py3 else \
-                                                          f'damask.Result.{creator} v{damask.version}'.encode()
+        Parameters
+        ----------
+        keep : (list of) str, optional
+            Names of the calculated datasets to store in the DADF5 file.
+            Defaults to None, in which case all calculated datasets are stored.
 
+        Examples
+        --------
+        Calculate Mises equivalent Cauchy stress without storing the Cauchy stress.
 
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> with r.pipeline(keep='sigma_vM'):
+        ...     r.add_stress_Cauchy()
+        ...     r.add_equivalent_Mises('sigma')
+
+        """
+        if self._pipeline is not None:
+            raise ValueError('nested pipelines')
+        self._pipeline = []
+        try:
+            yield self
+            steps = self._pipeline
+        finally:
+            self._pipeline = None
+        keep_ = [keep] if isinstance(keep,str) else keep
+        stages: List[Tuple[bool, List[Tuple[Callable, Dict[str, str], Dict[str, Any]]]]] = []
+        for func,datasets,args,spatial in steps:
+            if spatial or not stages or stages[-1][0]:
+                stages.append((spatial,[]))
+            stages[-1][1].append((func,datasets,args))
+        for i,(spatial,stage) in enumerate(stages):
+            if spatial:
+                self._add_generic_grid(*stage[0])
+            else:
+                required = [label for _,later in stages[i+1:] for _,datasets,_ in later for label in datasets.values()]
+                self._add_pointwise(stage,None if keep_ is None else keep_+required)
 
 
     def _add_generic_pointwise(self,
@@ -1468,99 +2185,263 @@ class Result:
             Arguments parsed to func.
 
         """
+        if self._pipeline is not None:
+            self._pipeline.append((func,datasets,args,False))
+        else:
+            self._add_pointwise([(func,datasets,args)])
+
+
+    def _add_pointwise(self,
+                       steps: List[Tuple[Callable[..., DADF5Dataset], Dict[str, str], Dict[str, Any]]],
+                       keep: Optional[List[str]] = None):
+        """
+        Add pointwise data calculated by a chain of callbacks.
 
-        def job_pointwise(group: str,
-                          callback: Callable[..., DADF5Dataset],
-                          datasets: Dict[str, str],
-                          args: Dict[str, str]) -> Union[None, DADF5Dataset]:
-            try:
-                datasets_in = {}
-                with h5py.File(self.fname,'r') as f:
-                    for arg,label in datasets.items():
-                        loc  = f[group+'/'+label]
-                        datasets_in[arg]={'data' :loc[()],
-                                          'label':label,
-                                          'meta': {k:(v.decode() if not h5py3 and type(v) is bytes else v) \
-                                                   for k,v in loc.attrs.items()}}
-                return callback(**datasets_in,**args)
-            except Exception as err:
-                print(f'Error during calculation: {err}.')
-                return None
-
-        groups = []
+        Parameters
+        ----------
+        steps : list of tuple
+            Callback, datasets, and arguments as for '_add_generic_pointwise'.
+            Datasets calculated by a callback are available to subsequent callbacks.
+        keep : list of str, optional
+            Labels of the datasets to store. Defaults to None (all).
+
+        """
+
+        def job_pointwise(datasets_in: Dict[str, DADF5Dataset]) -> Dict[int, Union[None, DADF5Dataset]]:
+            available = dict(datasets_in)
+            results: Dict[int, Union[None, DADF5Dataset]] = {}
+            for i,(callback,datasets,args) in enumerate(steps):
+                if not set(datasets.values()).issubset(available): continue
+                try:
+                    results[i] = callback(**{arg:available[label] for arg,label in datasets.items()},**args)
+                except Exception as err:
+                    print(f'Error during calculation: {err}.')
+                    results[i] = None
+                if results[i]: available[results[i]['label']] = results[i]                          # type: ignore
+            return results
+
+        def partition(f: h5py.File,
+                      group: str) -> Tuple[int, List[Union[slice, np.ndarray]]]:
+            """Split group into selections of material points that fit into the chunk budget."""
+            loc = [f['/'.join([group,label])] for label in inputs[group]]
+            N_points = loc[0].shape[0]
+            points = np.arange(N_points) if entries is None else entries[group.split('/')[1]][group.split('/')[2]]
+            if len(points) == 0:
+                return N_points,[] if entries is not None else [slice(0,0)]
+            bytes_per_point = sum([d.dtype.itemsize*int(np.prod(d.shape[1:])) for d in loc])
+            if self._chunk_budget is None or len(points)*bytes_per_point <= self._chunk_budget:
+                N = len(points)
+            else:
+                alignment = max([d.chunks[0] for d in loc if d.chunks is not None],default=1)   # HDF5 chunk layout
+                N = max(1,self._chunk_budget//bytes_per_point//alignment)*alignment
+            return N_points,[slice(p[0],p[-1]+1) if p[-1]-p[0]+1 == len(p) else p
+                             for p in [points[s:s+N] for s in range(0,len(points),N)]]
+
+        def read(f: h5py.File,
+                 group: str,
+                 points: Union[slice, np.ndarray]) -> Dict[str, DADF5Dataset]:
+            datasets_in: Dict[str, Any] = {}
+            for label in inputs[group]:
+                loc  = f[group+'/'+label]
+                datasets_in[label]={'data' :loc[points] if isinstance(points,slice) else _read_entries(loc,points),
+                                    'label':label,
+                                    'meta': {k:(v.decode() if not h5py3 and type(v) is bytes else v) \
+                                             for k,v in loc.attrs.items()}}
+            return datasets_in
+
+        def create(f: h5py.File,
+                   group: str,
+                   N_points: int,
+                   result: DADF5Dataset) -> h5py.Dataset:
+            if not self._protected and '/'.join([group,result['label']]) in f:
+                dataset = f['/'.join([group,result['label']])]
+                dataset.attrs['overwritten'] = True
+                if entries is None and 'partial' in dataset.attrs:
+                    del dataset.attrs['partial']
+            else:
+                shape = (N_points,)+result['data'].shape[1:]
+                dtype = _storage_dtype(self._storage,result['data'].dtype)
+                dataset = f[group].create_dataset(result['label'],shape=shape,dtype=dtype,
+                                                  maxshape=shape,
+                                                  fillvalue = None if entries is None else
+                                                              (np.nan if np.issubdtype(dtype,np.floating) else 0),
+                                                  **_storage_options(self._storage,shape,dtype))
+                if dtype != result['data'].dtype:
+                    dataset.attrs['original_dtype'] = str(result['data'].dtype)
+                if entries is not None:
+                    dataset.attrs['partial'] = True                                                 # only defined within region(s)
+
+            now = datetime.datetime.now().astimezone()
+            dataset.attrs['created'] = now.strftime('%Y-%m-%d %H:%M:%S%z') if h5py3 else \
+                                       now.strftime('%Y-%m-%d %H:%M:%S%z').encode()
+
+            for l,v in result['meta'].items():
+                dataset.attrs[l.lower()]=v.encode() if not h5py3 and type(v) is str else v
+            creator = dataset.attrs['creator'] if h5py3 else \
+                      dataset.attrs['creator'].decode()
+            dataset.attrs['creator'] = f'damask.Result.{creator} v{damask.version}' if h5py3 else \
+                                       f'damask.Result.{creator} v{damask.version}'.encode()
+            dataset.attrs['incomplete'] = True                                                      # removed once written
+            return dataset
+
+        def up_to_date(f: h5py.File,
+                       group: str,
+                       label: str,
+                       partial: bool = False) -> bool:
+            """Check whether a dataset is complete (or partial) and not older than the input datasets."""
+            if label not in f[group] or 'incomplete' in f[group][label].attrs \
+                                   or 'partial' in f[group][label].attrs and not partial: return False
+            created = _created(f[group][label])
+            return created is not None and \
+                   all(created >= c for c in [_created(f[group][l]) for l in inputs[group] if l != label]
+                       if c is not None)
+
+        def write(f: h5py.File,
+                  group: str,
+                  points: Union[slice, np.ndarray],
+                  first: bool,
+                  last: bool,
+                  N_points: int,
+                  results: Dict[int, Union[None, DADF5Dataset]]):
+            for i,result in results.items():
+                if (group,i) in failed or (group,i) in skipped: continue
+                if not result:
+                    failed.add((group,i))
+                    if (group,i) in written and 'incomplete' in written[(group,i)].attrs \
+                                            and 'overwritten' not in written[(group,i)].attrs:     # discard incomplete data
+                        del f[written[(group,i)].name]
+                    continue
+                labels.setdefault(i,result['label'])
+                if keep is not None and result['label'] not in keep: continue
+                try:
+                    if first and self._incremental and result['label'] in f[group]:
+                        dataset = f[group][result['label']]
+                        if 'incomplete' in dataset.attrs:
+                            del f[group][result['label']]
+                        elif 'partial' in dataset.attrs and \
+                             up_to_date(f,group,result['label'],partial=True):                      # add selected points
+                            written[(group,i)] = dataset
+                        elif up_to_date(f,group,result['label']):
+                            skipped.add((group,i))
+                            continue
+                        elif self._protected:
+                            print(f'Outdated dataset {group}/{result["label"]} is protected, not updated.')
+                            skipped.add((group,i))
+                            continue
+                    if first and (group,i) not in written:
+                        written[(group,i)] = create(f,group,N_points,result)
+                    written[(group,i)][points] = result['data']
+                    if last and 'incomplete' in written[(group,i)].attrs:
+                        del written[(group,i)].attrs['incomplete']
+                    if last and entries is None and 'partial' in written[(group,i)].attrs:
+                        del written[(group,i)].attrs['partial']
+                except (OSError,RuntimeError) as err:
+                    failed.add((group,i))
+                    print(f'Could not add dataset: {err}.')
+
+        inputs: Dict[str, List[str]] = {}
         with h5py.File(self.fname,'r') as f:
             for inc in self.visible['increments']:
                 for ty in ['phase','homogenization']:
                     for label in self.visible[ty+'s']:
                         for field in _match(self.visible['fields'],f['/'.join([inc,ty,label])].keys()):
                             group = '/'.join([inc,ty,label,field])
-                            if set(datasets.values()).issubset(f[group].keys()): groups.append(group)
+                            if any(set(datasets.values()).issubset(f[group].keys()) for _,datasets,_ in steps):
+                                inputs[group] = [label for label in dict.fromkeys(l for _,datasets,_ in steps
+                                                                                    for l in datasets.values())
+                                                 if label in f[group].keys()]
+        groups = list(inputs)
 
         if len(groups) == 0:
             print('No matching dataset found, no data was added.')
             return
 
-
-        for group in util.show_progress(groups):
-            if not (result := job_pointwise(group, callback=func, datasets=datasets, args=args)):   # type: ignore
-                continue
-            with h5py.File(self.fname, 'a') as f:
-                try:
-                    if not self._protected and '/'.join([group,result['label']]) in f:
-                        dataset = f['/'.join([group,result['label']])]
-                        dataset[...] = result['data']
-                        dataset.attrs['overwritten'] = True
-                    else:
-                        shape = result['data'].shape
-                        if compress := result['data'].size >= chunk_size*2:
-                            chunks = (chunk_size//np.prod(shape[1:]),)+shape[1:]
-                        else:
-                            chunks = shape
-                        dataset = f[group].create_dataset(result['label'],data=result['data'],
-                                                          maxshape=shape, chunks=chunks,
-                                                          compression = 'gzip' if compress else None,
-                                                          compression_opts = 6 if compress else None,
-                                                          shuffle=True,fletcher32=True)
-
-                    now = datetime.datetime.now().astimezone()
-                    dataset.attrs['created'] = now.strftime('%Y-%m-%d %H:%M:%S%z') if h5py3 else \
-                                               now.strftime('%Y-%m-%d %H:%M:%S%z').encode()
-
-                    for l,v in result['meta'].items():
-                        dataset.attrs[l.lower()]=v.encode() if not h5py3 and type(v) is str else v
-                    creator = dataset.attrs['creator'] if h5py3 else \
-                              dataset.attrs['creator'].decode()
-                    dataset.attrs['creator'] = f'damask.Result.{creator} v{damask.version}' if h5py3 else \
-                                               f'damask.Result.{creator} v{damask.version}'.encode()
-
-                except (OSError,RuntimeError) as err:
-                    print(f'Could not add dataset: {err}.')
+        # Single writer: one handle is kept open while the callbacks are evaluated by the workers.
+        # Pending jobs are bounded by the number of workers (plus one queued job) and written in order
+        # to limit memory consumption.
+        entries = self._entries()
+        written: Dict[Tuple[str, int], h5py.Dataset] = {}
+        failed: Set[Tuple[str, int]] = set()
+        skipped: Set[Tuple[str, int]] = set()
+        labels: Dict[int, str] = {}                                                                 # labels of the results
+        pending: Deque[Tuple[str, Union[slice, np.ndarray], bool, bool, int, concurrent.futures.Future]] = deque()
+
+        def write_next(f: h5py.File):
+            """Write the results of the oldest pending job."""
+            group,points,first,last,N_points,job = pending.popleft()
+            write(f,group,points,first,last,N_points,job.result())
+
+        with h5py.File(self.fname, 'a') as f, \
+             concurrent.futures.ThreadPoolExecutor(self._workers) as executor:
+            for group in util.show_progress(groups):
+                if self._incremental:
+                    while not labels and pending:                                                   # labels are needed to skip groups
+                        write_next(f)
+                    kept = [l for l in labels.values() if keep is None or l in keep]
+                    if kept and all(up_to_date(f,group,l) for l in kept): continue
+                N_points,selections = partition(f,group)
+                for i,points in enumerate(selections):
+                    pending.append((group,points,i==0,i==len(selections)-1,N_points,
+                                    executor.submit(job_pointwise,read(f,group,points))))
+                    if len(pending) > self._workers:
+                        write_next(f)
+            while pending:
+                write_next(f)
 
 
     def _mappings(self):
         """Mappings to place data spatially."""
-        with h5py.File(self.fname,'r') as f:
+        if not self._cell_to:
+            with h5py.File(self.fname,'r') as f:
+                entry_ph = f['/'.join(['cell_to','phase'])]['entry']
+                entry_ho = f['/'.join(['cell_to','homogenization'])]['entry']
+            self._cell_to['phase'] = [_group_by_label(self.phase[:,c],entry_ph[:,c]) \
+                                      for c in range(self.N_constituents)]
+            self._cell_to['homogenization'] = _group_by_label(self.homogenization,entry_ho)
+
+        empty = (np.empty(0,np.intp),np.empty(0,np.intp))
+        mapping_ph = [{label: m.get(label,empty) for label in self.visible['phases']} \
+                      for m in self._cell_to['phase']]
+        mapping_ho =  {label: self._cell_to['homogenization'].get(label,empty) \
+                       for label in self.visible['homogenizations']}
+
+        if self._region is not None:
+            start,mask = self._region
+            in_box = np.full(len(mask),-1,np.intp)                                                  # global to local cell index
+            in_box[_box_indices(start,self.cells,self._grid[0])] = np.arange(self.N_materialpoints)
+            def crop(at_cell,in_data):
+                inside = mask[at_cell]
+                return in_box[at_cell[inside]],in_data[inside]
+            mapping_ph = [{label: crop(*m[label]) for label in m} for m in mapping_ph]
+            mapping_ho =  {label: crop(*mapping_ho[label]) for label in mapping_ho}
+
+        at_cell_ph = [{label: at_cell for label,(at_cell,_) in m.items()} for m in mapping_ph]
+        in_data_ph = [{label: in_data for label,(_,in_data) in m.items()} for m in mapping_ph]
+        at_cell_ho =  {label: at_cell for label,(at_cell,_) in mapping_ho.items()}
+        in_data_ho =  {label: in_data for label,(_,in_data) in mapping_ho.items()}
 
-            at_cell_ph = []
-            in_data_ph = []
-            for c in range(self.N_constituents):
-                at_cell_ph.append({label: np.where(self.phase[:,c] == label)[0] \
-                                          for label in self.visible['phases']})
-                in_data_ph.append({label: f['/'.join(['cell_to','phase'])]['entry'][at_cell_ph[c][label]][:,c] \
-                                          for label in self.visible['phases']})
+        return at_cell_ph,in_data_ph,at_cell_ho,in_data_ho
 
-            at_cell_ho = {label: np.where(self.homogenization[:] == label)[0] \
-                                 for label in self.visible['homogenizations']}
-            in_data_ho = {label: f['/'.join(['cell_to','homogenization'])]['entry'][at_cell_ho[label]] \
-                                 for label in self.visible['homogenizations']}
 
-        return at_cell_ph,in_data_ph,at_cell_ho,in_data_ho
+    def _entries(self) -> Optional[Dict[str, Dict[str, np.ndarray]]]:
+        """Entries of the datasets that are located within the spatial region."""
+        if self._region is None: return None
+
+        _,in_data_ph,_,in_data_ho = self._mappings()
+        start = self._region[0]
+        return {'phase':          {label: _compact({str(c):m[label] for c,m in enumerate(in_data_ph)})[0] \
+                                   for label in self.visible['phases']},
+                'homogenization': {label: _compact({'':in_data_ho[label]})[0] \
+                                   for label in self.visible['homogenizations']},
+                'geometry':       {'u_p': _box_indices(start,self.cells,self._grid[0]),
+                                   'u_n': _box_indices(start,self.cells+1,self._grid[0]+1)}}
 
 
     def get(self,
             output: Union[str, List[str]] = '*',
             flatten: bool = True,
-            prune: bool = True) -> Union[None,Dict[str,Any]]:
+            prune: bool = True,
+            lazy: bool = False) -> Union[None,Dict[str,Any]]:
         """
         Collect data per phase/homogenization reflecting the group/folder structure in the DADF5 file.
 
@@ -1575,13 +2456,32 @@ class Result:
             phase/homogenization, or field. Defaults to True.
         prune : bool, optional
             Remove branches with no data. Defaults to True.
+        lazy : bool, optional
+            Return proxies that read data only on access (slicing or
+            iteration over chunks) instead of numpy.ndarray.
+            Defaults to False.
 
         Returns
         -------
         data : dict of numpy.ndarray
             Datasets structured by phase/homogenization and according to selected view.
 
+        Examples
+        --------
+        Read the first ten entries of the deformation gradient
+        of phase 'A' in the last increment:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5').view(increments=-1,phases='A')
+        >>> r.get('F',lazy=True)[:10]
+
         """
+        def read(dataset: h5py.Dataset,
+                 entries: Optional[np.ndarray]) -> Union[np.ndarray, _LazyDataset]:
+            return _LazyDataset(self.fname,dataset.name,dataset.shape,dataset.chunks,entries) if lazy else \
+                   _read(dataset,entries)
+
+        entries = self._entries()
         r: Dict[str,Any] = {}
 
         with h5py.File(self.fname,'r') as f:
@@ -1589,7 +2489,8 @@ class Result:
                 r[inc] = {'phase':{},'homogenization':{},'geometry':{}}
 
                 for out in _match(output,f['/'.join([inc,'geometry'])].keys()):
-                    r[inc]['geometry'][out] = _read(f['/'.join([inc,'geometry',out])])
+                    r[inc]['geometry'][out] = read(f['/'.join([inc,'geometry',out])],
+                                                   None if entries is None else entries['geometry'].get(out))
 
                 for ty in ['phase','homogenization']:
                     for label in self.visible[ty+'s']:
@@ -1597,7 +2498,8 @@ class Result:
                         for field in _match(self.visible['fields'],f['/'.join([inc,ty,label])].keys()):
                             r[inc][ty][label][field] = {}
                             for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                r[inc][ty][label][field][out] = _read(f['/'.join([inc,ty,label,field,out])])
+                                r[inc][ty][label][field][out] = read(f['/'.join([inc,ty,label,field,out])],
+                                                                     None if entries is None else entries[ty][label])
 
         if prune:   r = util.dict_prune(r)
         if flatten: r = util.dict_flatten(r)
@@ -1605,13 +2507,205 @@ class Result:
         return None if (type(r) == dict and r == {}) else r
 
 
+    def get_timeseries(self,
+                       output: str,
+                       cells: Union[None, int, IntSequence, slice] = None,
+                       constituent: int = 0,
+                       fill_float: float = np.nan,
+                       fill_int: int = 0) -> Optional[np.ma.core.MaskedArray]:
+        """
+        Collect data of selected cells for all visible increments.
+
+        Only the entries of the datasets that correspond to the
+        selected cells are read.
+
+        Parameters
+        ----------
+        output : str
+            Name of the dataset to read.
+        cells : (sequence of) int or slice, optional
+            Indices of the cells in spatial order.
+            Defaults to None, in which case all cells are selected.
+        constituent : int, optional
+            Constituent to consider for phase data.
+            Defaults to 0.
+        fill_float : float, optional
+            Fill value for non-existent entries of floating point type.
+            Defaults to NaN.
+        fill_int : int, optional
+            Fill value for non-existent entries of integer type.
+            Defaults to 0.
+
+        Returns
+        -------
+        data : numpy.ma.MaskedArray, shape (:,:,...)
+            Data of the selected cells (second axis) for each visible increment (first axis).
+
+        Examples
+        --------
+        Get the Cauchy stress at cells 0, 10, and 20 for all increments:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r.add_stress_Cauchy()
+        >>> sigma = r.get_timeseries('sigma',cells=[0,10,20])
+
+        """
+        cells_ = np.atleast_1d(np.arange(self.N_materialpoints)[slice(None) if cells is None else cells])
+
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
+        selection = {'phase':         {label:_select(at_cell_ph[constituent][label],in_data_ph[constituent][label],cells_)
+                                       for label in self.visible['phases']},
+                     'homogenization':{label:_select(at_cell_ho[label],in_data_ho[label],cells_)
+                                       for label in self.visible['homogenizations']}}
+
+        r: Optional[np.ma.core.MaskedArray] = None
+        location = None
+        with h5py.File(self.fname,'r') as f:
+            for i,inc in enumerate(util.show_progress(self.visible['increments'])):
+                for ty in ['phase','homogenization']:
+                    for label in self.visible[ty+'s']:
+                        found,entries,inverse = selection[ty][label]
+                        for field in _match(self.visible['fields'],f['/'.join([inc,ty,label])].keys()):
+                            if output not in f['/'.join([inc,ty,label,field])].keys(): continue
+
+                            if location is None:
+                                location = (ty,field)
+                            elif location != (ty,field):
+                                raise ValueError(f'ambiguous dataset "{output}"')
+
+                            dataset = f['/'.join([inc,ty,label,field,output])]
+                            if r is None:
+                                dtype = _dtype(dataset)
+                                r = ma.array(np.empty((len(self.visible['increments']),len(cells_))+dataset.shape[1:],dtype),
+                                             fill_value = fill_float if np.issubdtype(dtype,np.floating) else fill_int,
+                                             mask = True)
+                            if len(entries) > 0:
+                                r[i,found] = _read_entries(dataset,entries)[inverse]
+
+        return r
+
+
+    def reduce(self,
+               output: str,
+               ops: Union[str, Sequence[str]] = ('mean','std','min','max'),
+               by: Literal[None, 'label'] = None,
+               bins: int = 10,
+               range: Optional[Tuple[float, float]] = None) -> Table:
+        """
+        Calculate statistics of a dataset for all visible increments.
+
+        The datasets are processed in chunks using one-pass accumulators
+        and are never read completely into memory.
+
+        Parameters
+        ----------
+        output : str
+            Name of the dataset to reduce.
+        ops : (sequence of) {'mean', 'std', 'min', 'max', 'hist'}, optional
+            Statistics to calculate. Defaults to ('mean','std','min','max').
+            Mean and (population) standard deviation are not weighted,
+            'hist' is only available for scalar datasets.
+        by : {None, 'label'}, optional
+            Group the statistics by phase/homogenization label.
+            Defaults to None, in which case all visible labels are combined.
+        bins : int, optional
+            Number of bins of the histogram. Defaults to 10.
+        range : tuple of float, len (2), optional
+            Lower and upper limit of the histogram.
+            Defaults to None, in which case the limits of the data are used.
+
+        Returns
+        -------
+        statistics : damask.Table
+            Statistics per increment (row) with increment number
+            and time in columns 'increment' and 't'.
+
+        Examples
+        --------
+        Mean Mises equivalent Cauchy stress and Mises equivalent strain:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r.add_stress_Cauchy()
+        >>> r.add_strain()
+        >>> r.add_equivalent_Mises('sigma')
+        >>> r.add_equivalent_Mises('epsilon_V^0.0(F)')
+        >>> sigma = r.reduce('sigma_vM','mean')
+        >>> epsilon = r.reduce('epsilon_V^0.0(F)_vM','mean')
+
+        """
+        ops_ = [ops] if isinstance(ops,str) else list(ops)
+        if invalid := set(ops_).difference(['mean','std','min','max','hist']):
+            raise ValueError(f'invalid operation(s) "{invalid}"')
+
+        entries = self._entries()
+
+        def accumulate(edges: Optional[np.ndarray]) -> Tuple[List[Dict[str, _Accumulator]], Dict[str, Any]]:
+            accumulators: List[Dict[str, _Accumulator]] = []
+            meta: Dict[str, Any] = {}
+            with h5py.File(self.fname,'r') as f:
+                for inc in util.show_progress(self.visible['increments']):
+                    accumulators.append({})
+                    for ty in ['phase','homogenization']:
+                        for label in self.visible[ty+'s']:
+                            for field in _match(self.visible['fields'],f['/'.join([inc,ty,label])].keys()):
+                                if output not in f['/'.join([inc,ty,label,field])].keys(): continue
+
+                                if meta.setdefault('location',(ty,field)) != (ty,field):
+                                    raise ValueError(f'ambiguous dataset "{output}"')
+
+                                dataset = f['/'.join([inc,ty,label,field,output])]
+                                if 'hist' in ops_ and dataset.shape[1:] != ():
+                                    raise ValueError(f'histogram of non-scalar dataset "{output}"')
+                                meta.setdefault('shape',dataset.shape[1:])
+                                meta.setdefault('unit',_dtype(dataset).metadata.get('unit','n/a'))  # type: ignore
+
+                                acc = accumulators[-1].setdefault(label if by == 'label' else '',_Accumulator(edges))
+                                for data in _iter_chunks(dataset,None if entries is None else entries[ty][label],
+                                                         self._chunk_budget):
+                                    acc.add(data)
+            return accumulators,meta
+
+        edges = None
+        if 'hist' in ops_:
+            if range is None:
+                limits,_ = accumulate(None)
+                minima = [a.min for acc in limits for a in acc.values() if a.N > 0]
+                maxima = [a.max for acc in limits for a in acc.values() if a.N > 0]
+                range = (np.min(minima),np.max(maxima)) if minima else (0.,1.)
+            edges = np.histogram_bin_edges([],bins,range)
+
+        accumulators,meta = accumulate(edges)
+
+        keys = sorted(set([k for acc in accumulators for k in acc]),key=util.natural_sort)
+        shape = meta.get('shape',())
+        incs = [int(i.split(prefix_inc)[-1]) for i in self.visible['increments']]
+        times = [self.times[self.increments.index(i)] for i in self.visible['increments']]
+
+        comments = [util.execution_stamp('Result','reduce'),f'{output} / {meta.get("unit","n/a")}']
+        if edges is not None: comments.append(f'hist({output}) bin edges: {" ".join(map(str,edges))}')
+        table = Table({'increment':(1,),'t':(1,)},np.array([incs,times]).T,comments)
+        table.data['increment'] = table.data['increment'].astype(int)
+
+        for key in keys:
+            empty = _Accumulator(edges)
+            for op in ops_:
+                data = np.array([np.broadcast_to(getattr(acc.get(key,empty),op),(bins,) if op == 'hist' else shape)
+                                 for acc in accumulators])
+                table = table.set(f'{key}/{op}({output})' if key else f'{op}({output})',data)
+
+        return table
+
+
     def place(self,
               output: Union[str, List[str]] = '*',
               flatten: bool = True,
               prune: bool = True,
               constituents: Optional[IntSequence] = None,
               fill_float: float = np.nan,
-              fill_int: int = 0) -> Optional[Dict[str,Any]]:
+              fill_int: int = 0,
+              lazy: bool = False) -> Optional[Dict[str,Any]]:
         """
         Merge data into spatial order that is compatible with the damask.VTK geometry representation.
 
@@ -1641,6 +2735,10 @@ class Result:
         fill_int : int, optional
             Fill value for non-existent entries of integer type.
             Defaults to 0.
+        lazy : bool, optional
+            Return proxies that read data only on access (selection of
+            cells or iteration over chunks) instead of numpy.ma.MaskedArray.
+            Defaults to False.
 
         Returns
         -------
@@ -1648,6 +2746,24 @@ class Result:
             Datasets structured by spatial position and according to selected view.
 
         """
+        def empty_like(data: Union[h5py.Dataset, np.ma.core.MaskedArray],
+                       name: str) -> Union[np.ma.core.MaskedArray, _LazyPlacedDataset]:
+            if lazy:
+                return _LazyPlacedDataset(self.fname,name,(self.N_materialpoints,)+data.shape[1:],
+                                          data.name,fill_float,fill_int)                            # type: ignore
+            return _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+
+        def place_into(placed: Union[np.ma.core.MaskedArray, _LazyPlacedDataset],
+                       data: Union[h5py.Dataset, np.ma.core.MaskedArray],
+                       at_cell: np.ndarray,
+                       in_data: np.ndarray,
+                       entries: Optional[np.ndarray]):
+            if lazy:
+                placed.add_source(data.name,at_cell,in_data)                                        # type: ignore
+            else:
+                placed[at_cell] = data[in_data if entries is None else np.searchsorted(entries,in_data)]  # type: ignore
+
+        entries = self._entries()
         r: Dict[str,Any] = {}
 
         constituents_ = map(int,constituents) if isinstance(constituents,Iterable) else \
@@ -1664,7 +2780,10 @@ class Result:
                 r[inc] = {'phase':{},'homogenization':{},'geometry':{}}
 
                 for out in _match(output,f['/'.join([inc,'geometry'])].keys()):
-                    r[inc]['geometry'][out] = ma.array(_read(f['/'.join([inc,'geometry',out])]),fill_value = fill_float)
+                    dataset = f['/'.join([inc,'geometry',out])]
+                    e = None if entries is None else entries['geometry'].get(out)
+                    r[inc]['geometry'][out] = _LazyDataset(self.fname,dataset.name,dataset.shape,dataset.chunks,e) if lazy else \
+                                              ma.array(_read(dataset,e),fill_value = fill_float)
 
                 for ty in ['phase','homogenization']:
                     for label in self.visible[ty+'s']:
@@ -1672,24 +2791,26 @@ class Result:
                             if field not in r[inc][ty].keys():
                                 r[inc][ty][field] = {}
 
+                            e = None if entries is None else entries[ty][label]
                             for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                data = ma.array(_read(f['/'.join([inc,ty,label,field,out])]))
+                                data = f['/'.join([inc,ty,label,field,out])] if lazy else \
+                                       ma.array(_read(f['/'.join([inc,ty,label,field,out])],e))
 
                                 if ty == 'phase':
                                     if out+suffixes[0] not in r[inc][ty][field].keys():
                                         for c,suffix in zip(constituents_,suffixes):
                                             r[inc][ty][field][out+suffix] = \
-                                                _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+                                                empty_like(data,'/'.join([inc,ty,field,out+suffix]))
 
                                     for c,suffix in zip(constituents_,suffixes):
-                                        r[inc][ty][field][out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
+                                        place_into(r[inc][ty][field][out+suffix],data,at_cell_ph[c][label],in_data_ph[c][label],e)
 
                                 if ty == 'homogenization':
                                     if out not in r[inc][ty][field].keys():
                                         r[inc][ty][field][out] = \
-                                            _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+                                            empty_like(data,'/'.join([inc,ty,field,out]))
 
-                                    r[inc][ty][field][out][at_cell_ho[label]] = data[in_data_ho[label]]
+                                    place_into(r[inc][ty][field][out],data,at_cell_ho[label],in_data_ho[label],e)
 
         if prune:   r = util.dict_prune(r)
         if flatten: r = util.dict_flatten(r)
@@ -1700,12 +2821,13 @@ class Result:
     def export_XDMF(self,
                     output: Union[str, List[str]] = '*',
                     target_dir: Union[None, str, Path] = None,
-                    absolute_path: bool = False):
+                    absolute_path: bool = False,
+                    fill_float: float = np.nan,
+                    fill_int: int = 0):
         """
         Write XDMF file to directly visualize data from DADF5 file.
 
-        The XDMF format is only supported for structured grids
-        with single phase and single constituent.
+        The XDMF format is only supported for structured grids.
         For other cases use `export_VTK`.
 
         Parameters
@@ -1719,15 +2841,26 @@ class Result:
             Store absolute (instead of relative) path to DADF5 file.
             Defaults to False, i.e. the XDMF file expects the
             DADF5 file at a stable relative path.
+        fill_float : float, optional
+            Fill value for non-existent entries of floating point type.
+            Defaults to NaN.
+        fill_int : int, optional
+            Fill value for non-existent entries of integer type.
+            Defaults to 0.
 
         Notes
         -----
-        This function is implemented only for structured grids with
-        one constituent and a single phase.
+        This function is implemented only for structured grids.
+        Datasets that are not stored in spatial order, i.e. for multiple
+        phases or constituents, are reassembled by HDF5 virtual datasets
+        without copying the data. These are stored in a separate file
+        ('<name>_virtual.hdf5') next to the XDMF file.
 
         """
-        if self.N_constituents != 1 or len(self.phases) != 1 or not self.structured:
-            raise NotImplementedError('not a structured grid with one constituent and a single phase')
+        if not self.structured:
+            raise NotImplementedError('not a structured grid')
+        if self._region is not None:
+            raise NotImplementedError('XDMF export of a spatial region')
 
         attribute_type_map = defaultdict(lambda:'Matrix', ( ((),'Scalar'), ((3,),'Vector'), ((3,3),'Tensor')) )
 
@@ -1765,6 +2898,12 @@ class Result:
         hdf5_dir  = self.fname.parent
         out_dir   = Path.cwd() if target_dir is None else Path(target_dir)
         hdf5_link = (hdf5_dir if absolute_path else Path(os.path.relpath(hdf5_dir,out_dir.resolve())))/hdf5_name
+        virtual_name = f'{self.fname.stem}_virtual.hdf5'
+        virtual_link = (out_dir.resolve() if absolute_path else Path('.'))/virtual_name
+
+        suffixes = [''] if self.N_constituents == 1 else [f'#{c}' for c in range(self.N_constituents)]
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
+        layouts = {}
 
         with h5py.File(self.fname,'r') as f:
             for inc in self.visible['increments']:
@@ -1802,33 +2941,144 @@ class Result:
                                          'Dimensions': '{} {} {} 3'.format(*(self.cells[::-1]+1))}
                 data_items[-1].text = f'{hdf5_link}:/{inc}/geometry/u_n'
                 for ty in ['phase','homogenization']:
+                    sources: Dict[str, List[Tuple[str, np.ndarray, np.ndarray]]] = defaultdict(list)
                     for label in self.visible[ty+'s']:
                         for field in _match(self.visible['fields'],f['/'.join([inc,ty,label])].keys()):
                             for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
                                 name = '/'.join([inc,ty,label,field,out])
-                                shape = f[name].shape[1:]
-                                dtype = f[name].dtype
-
-                                unit = f[name].attrs['unit'] if h5py3 else \
-                                       f[name].attrs['unit'].decode()
-
-                                attributes.append(ET.SubElement(grid, 'Attribute'))
-                                attributes[-1].attrib = {'Name':          '/'.join([ty,field,out])+f' / {unit}',
-                                                         'Center':       'Cell',
-                                                         'AttributeType': attribute_type_map[shape]}
-                                data_items.append(ET.SubElement(attributes[-1], 'DataItem'))
-                                data_items[-1].attrib = {'Format':     'HDF',
-                                                         'NumberType': number_type_map(dtype),
-                                                         'Precision':  f'{dtype.itemsize}',
-                                                         'Dimensions': '{} {} {} {}'.format(*self.cells[::-1],1 if shape == () else
-                                                                                                        np.prod(shape))}
-                                data_items[-1].text = f'{hdf5_link}:{name}'
+                                if ty == 'phase':
+                                    for c,suffix in enumerate(suffixes):
+                                        if len(at_cell_ph[c][label]) > 0:
+                                            sources['/'.join([ty,field,out])+suffix].append((name,at_cell_ph[c][label],
+                                                                                              in_data_ph[c][label]))
+                                else:
+                                    sources['/'.join([ty,field,out])].append((name,at_cell_ho[label],in_data_ho[label]))
+
+                    for attribute,source in sources.items():
+                        name = source[0][0]
+                        shape = f[name].shape[1:]
+                        dtype = f[name].dtype
+
+                        unit = f[name].attrs['unit'] if h5py3 else \
+                               f[name].attrs['unit'].decode()
+
+                        attributes.append(ET.SubElement(grid, 'Attribute'))
+                        attributes[-1].attrib = {'Name':          f'{attribute} / {unit}',
+                                                 'Center':       'Cell',
+                                                 'AttributeType': attribute_type_map[shape]}
+                        data_items.append(ET.SubElement(attributes[-1], 'DataItem'))
+                        data_items[-1].attrib = {'Format':     'HDF',
+                                                 'NumberType': number_type_map(dtype),
+                                                 'Precision':  f'{dtype.itemsize}',
+                                                 'Dimensions': '{} {} {} {}'.format(*self.cells[::-1],1 if shape == () else
+                                                                                                np.prod(shape))}
+
+                        if len(source) == 1 and f[name].shape[0] == self.N_materialpoints \
+                                            and np.array_equal(source[0][1],np.arange(self.N_materialpoints)) \
+                                            and np.array_equal(source[0][2],np.arange(self.N_materialpoints)):
+                            data_items[-1].text = f'{hdf5_link}:{name}'                             # spatially ordered
+                        else:
+                            virtual = '/'.join([inc,attribute])
+                            layouts[virtual] = h5py.VirtualLayout((self.N_materialpoints,)+shape,dtype)
+                            for name,at_cell,in_data in source:
+                                v_source = h5py.VirtualSource(str(hdf5_link),name,f[name].shape,dtype)
+                                for c,d,N in _runs(at_cell,in_data):
+                                    layouts[virtual][c:c+N] = v_source[d:d+N]
+                            data_items[-1].text = f'{virtual_link}:/{virtual}'
+
+        if layouts:
+            out_dir.mkdir(parents=True,exist_ok=True)
+            with h5py.File(out_dir/virtual_name,'w') as f:
+                for virtual,layout in layouts.items():
+                    f.create_virtual_dataset(virtual,layout,
+                                             fill_float if np.issubdtype(layout.dtype,np.floating) else fill_int)
 
         out_dir.mkdir(parents=True,exist_ok=True)
         with util.open_text((out_dir/hdf5_name).with_suffix('.xdmf'),'w') as f:
             f.write(xml.dom.minidom.parseString(ET.tostring(xdmf).decode()).toprettyxml())
 
 
+    def _VTK_arrays(self,
+                    f: h5py.File,
+                    output: Union[str,List[str]],
+                    mode: str,
+                    constituents: Optional[IntSequence],
+                    fill_float: float,
+                    fill_int: int):
+        """
+        Assemble point or cell data of the visible increments for VTK export.
+
+        Parameters
+        ----------
+        f : h5py.File
+            Opened DADF5 file.
+        output : (list of) str
+            Names of the datasets to export.
+        mode : {'cell', 'point'}
+            Export in cell format or point format.
+        constituents : (list of) int or None
+            Constituents to consider.
+        fill_float : float
+            Fill value for non-existent entries of floating point type.
+        fill_int : int
+            Fill value for non-existent entries of integer type.
+
+        Yields
+        ------
+        inc : str
+            Name of the increment.
+        arrays : dict
+            Displacement 'u' and datasets labeled as 'type/label/field/output / unit'.
+
+        """
+        constituents_ = constituents if isinstance(constituents,Iterable) else \
+                        (range(self.N_constituents) if constituents is None else [constituents])    # type: ignore
+
+        suffixes = [''] if self.N_constituents == 1 or isinstance(constituents,int) else \
+                   [f'#{c}' for c in constituents_]
+
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
+        if (entries := self._entries()) is not None:                                                # read only spatial region
+            in_data_ph = [{label: np.searchsorted(entries['phase'][label],m[label]) for label in m} for m in in_data_ph]
+            in_data_ho =  {label: np.searchsorted(entries['homogenization'][label],in_data_ho[label]) for label in in_data_ho}
+
+        for inc in util.show_progress(self.visible['increments']):
+
+            label = 'u_n' if mode.lower() == 'cell' else 'u_p'
+            arrays: Dict[str, np.ndarray] = \
+                {'u':_read(f['/'.join([inc,'geometry',label])],None if entries is None else entries['geometry'][label])}
+
+            for ty in ['phase','homogenization']:
+                for field in self.visible['fields']:
+                    outs: Dict[str, np.ma.core.MaskedArray] = {}
+                    for label in self.visible[ty+'s']:
+                        if field not in f['/'.join([inc,ty,label])].keys(): continue
+
+                        for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
+                            data = ma.array(_read(f['/'.join([inc,ty,label,field,out])],
+                                                  None if entries is None else entries[ty][label]))
+
+                            if ty == 'phase':
+                                if out+suffixes[0] not in outs.keys():
+                                    for c,suffix in zip(constituents_,suffixes):
+                                        outs[out+suffix] = \
+                                            _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+
+                                for c,suffix in zip(constituents_,suffixes):
+                                    outs[out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
+
+                            if ty == 'homogenization':
+                                if out not in outs.keys():
+                                    outs[out] = _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+
+                                outs[out][at_cell_ho[label]] = data[in_data_ho[label]]
+
+                    for label,dataset in outs.items():
+                        arrays[' / '.join(['/'.join([ty,field,label]),dataset.dtype.metadata['unit']])] = dataset
+
+            yield inc,arrays
+
+
     def export_VTK(self,
                    output: Union[str,List[str]] = '*',
                    mode: str = 'cell',
@@ -1866,7 +3116,8 @@ class Result:
             Fill value for non-existent entries of integer type.
             Defaults to 0.
         parallel : bool, optional
-            Write VTK files in parallel in a separate background process.
+            Write VTK files in parallel background processes.
+            The number of processes is limited by the number of workers.
             Defaults to True.
 
         """
@@ -1881,58 +3132,116 @@ class Result:
 
         N_digits = int(np.floor(np.log10(max(1,self.incs[-1]))))+1
 
-        constituents_ = constituents if isinstance(constituents,Iterable) else \
-                        (range(self.N_constituents) if constituents is None else [constituents])    # type: ignore
-
-        suffixes = [''] if self.N_constituents == 1 or isinstance(constituents,int) else \
-                   [f'#{c}' for c in constituents_]
-
-        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
-
         out_dir = Path.cwd() if target_dir is None else Path(target_dir)
         out_dir.mkdir(parents=True,exist_ok=True)
 
-        with h5py.File(self.fname,'r') as f:
+        with h5py.File(self.fname,'r') as f, _WriterPool(self._workers if parallel else 0) as pool:
             if self.version_minor >= 13:
                 creator = f.attrs['creator'] if h5py3 else f.attrs['creator'].decode()
                 created = f.attrs['created'] if h5py3 else f.attrs['created'].decode()
                 v.comments += [f'{creator} ({created})']
 
-            for inc in util.show_progress(self.visible['increments']):
+            for inc,arrays in self._VTK_arrays(f,output,mode,constituents,fill_float,fill_int):
+                pool.submit(v.set_many(arrays),out_dir/f'{self.fname.stem}_inc{inc.split(prefix_inc)[-1].zfill(N_digits)}')
 
-                u = _read(f['/'.join([inc,'geometry','u_n' if mode.lower() == 'cell' else 'u_p'])])
-                v = v.set('u',u)
 
-                for ty in ['phase','homogenization']:
-                    for field in self.visible['fields']:
-                        outs: Dict[str, np.ma.core.MaskedArray] = {}
-                        for label in self.visible[ty+'s']:
-                            if field not in f['/'.join([inc,ty,label])].keys(): continue
+    def export_VTKHDF(self,
+                      output: Union[str,List[str]] = '*',
+                      mode: str = 'cell',
+                      constituents: Optional[IntSequence] = None,
+                      target_dir: Union[None, str, Path] = None,
+                      fill_float: float = np.nan,
+                      fill_int: int = 0):
+        """
+        Export to VTKHDF time series of cell/point data.
 
-                            for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                data = ma.array(_read(f['/'.join([inc,ty,label,field,out])]))
+        One VTKHDF file containing all visible increments is created.
+        The geometry is stored only once and shared among the increments.
+        For point data and mesh-based simulations, the VTK format is
+        UnstructuredGrid, for cell data of grid-based simulations,
+        it is ImageData.
 
-                                if ty == 'phase':
-                                    if out+suffixes[0] not in outs.keys():
-                                        for c,suffix in zip(constituents_,suffixes):
-                                            outs[out+suffix] = \
-                                                _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+        Parameters
+        ----------
+        output : (list of) str, optional
+            Names of the datasets to export to the VTKHDF file.
+            Defaults to '*', in which case all visible datasets are exported.
+        mode : {'cell', 'point'}, optional
+            Export in cell format or point format.
+            Defaults to 'cell'.
+        constituents : (list of) int, optional
+            Constituents to consider.
+            Defaults to None, in which case all constituents are considered.
+        target_dir : str or pathlib.Path, optional
+            Directory to save VTKHDF file. Will be created if non-existent.
+        fill_float : float, optional
+            Fill value for non-existent entries of floating point type.
+            Defaults to NaN.
+        fill_int : int, optional
+            Fill value for non-existent entries of integer type.
+            Defaults to 0.
 
-                                    for c,suffix in zip(constituents_,suffixes):
-                                        outs[out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
+        Notes
+        -----
+        Reading VTKHDF time series requires VTK 9.3 or ParaView 5.12 or newer.
+        Since HDF5 uses '/' as path separator, it is replaced by '∕'
+        (U+2215, division slash) in the labels of the datasets.
 
-                                if ty == 'homogenization':
-                                    if out not in outs.keys():
-                                        outs[out] = _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+        """
+        if mode.lower()=='cell':
+            v = self.geometry0
+        elif mode.lower()=='point':
+            v = VTK.from_poly_data(self.coordinates0_point)
+        else:
+            raise ValueError(f'invalid mode "{mode}"')
 
-                                    outs[out][at_cell_ho[label]] = data[in_data_ho[label]]
+        times = [self.times[self.increments.index(i)] for i in self.visible['increments']]
+        dims: Dict[str, Optional[np.ndarray]] = \
+            {'PointData': np.array(v.vtk_data.GetDimensions()) if isinstance(v.vtk_data,vtkImageData) else None,
+             'CellData':  np.array(self.cells) if isinstance(v.vtk_data,vtkImageData) else None}
 
-                        for label,dataset in outs.items():
-                            v = v.set(' / '.join(['/'.join([ty,field,label]),dataset.dtype.metadata['unit']]),dataset)
+        out_dir = Path.cwd() if target_dir is None else Path(target_dir)
+        out_dir.mkdir(parents=True,exist_ok=True)
 
+        with h5py.File(self.fname,'r') as f, h5py.File(out_dir/f'{self.fname.stem}.vtkhdf','w') as f_out:
+            f_out.attrs['creator'] = util.execution_stamp('Result','export_VTKHDF')
+            root = f_out.create_group('VTKHDF')
+            root.attrs['Version'] = np.array([2,0],np.int64)
+            _VTKHDF_geometry(root,v)
+
+            steps = root.create_group('Steps')
+            steps.attrs['NSteps'] = len(times)
+            steps.create_dataset('Values',data=times)
+            if not v.vtk_data.IsA('vtkImageData'):                                                  # geometry is shared
+                for label in ['PartOffsets','PointOffsets','CellOffsets','ConnectivityIdOffsets']:
+                    steps.create_dataset(label,data=np.zeros(len(times),np.int64))
+                steps.create_dataset('NumberOfParts',data=np.ones(len(times),np.int64))
+
+            for i,(_,arrays) in enumerate(self._VTK_arrays(f,output,mode,constituents,fill_float,fill_int)):
+                for label,data in arrays.items():
+                    name = label.replace('/','∕')
+                    data_ = np.where(data.mask,data.fill_value,data) if isinstance(data,np.ma.MaskedArray) else data
+                    data_ = data_.reshape(len(data_),-1) \
+                                 .astype(np.single if data_.dtype in [np.double,np.longdouble] else data_.dtype)
+
+                    for ty,N in [('PointData',v.N_points),('CellData',v.N_cells)]:
+                        if len(data_) != N: continue
+                        if ty == 'CellData' and N == v.N_points and dims[ty] is None:
+                            if name not in root.require_group(ty):                                  # vertices, share point data
+                                root[ty][name] = root['PointData'][name]
+                                steps.require_group('CellDataOffsets')[name] = steps['PointDataOffsets'][name]
+                            continue
+                        dims_ = dims[ty]
+                        block = data_ if dims_ is None else data_.reshape(1,*dims_[::-1],-1)
+                        if name not in root.require_group(ty):
+                            fill = fill_float if np.issubdtype(block.dtype,np.floating) else fill_int
+                            root[ty].create_dataset(name,shape=(len(times)*len(block),)+block.shape[1:],
+                                                    dtype=block.dtype,fillvalue=fill,chunks=block.shape,
+                                                    compression='gzip')
+                            steps.require_group(f'{ty}Offsets') \
+                                 .create_dataset(name,data=np.arange(len(times),dtype=np.int64)*len(block))
+                        root[ty][name][i*len(block):(i+1)*len(block)] = block
 
-                v.save(out_dir/f'{self.fname.stem}_inc{inc.split(prefix_inc)[-1].zfill(N_digits)}',
-                       parallel=parallel)
 
     def export_DREAM3D(self,
                        q: str = 'O',
@@ -2066,7 +3375,8 @@ class Result:
     def export_DADF5(self,
                      fname,
                      output: Union[str, List[str]] = '*',
-                     mapping = None):
+                     mapping = None,
+                     storage: Optional[Dict[str, Any]] = None):
         """
         Export visible components into a new DADF5 file.
 
@@ -2082,17 +3392,30 @@ class Result:
             Defaults to '*', in which case all visible datasets are exported.
         mapping : numpy.ndarray of int, shape (:,:,:), optional
             Indices for regridding.
+        storage : dict, optional
+            Storage policy for rewriting the exported datasets, see `Result`.
+            Defaults to None, in which case the datasets are copied
+            with their original storage layout.
 
         """
         if Path(fname).expanduser().absolute() == self.fname:
             raise PermissionError(f'cannot overwrite {self.fname}')
+        if self._region is not None:
+            raise NotImplementedError('DADF5 export of a spatial region')
+
+        policy = None if storage is None else _storage_policy(storage)
 
         def cp(path_in,path_out,label,mapping):
-            if mapping is None:
+            if mapping is None and policy is None:
                 path_in.copy(label,path_out)
             else:
-                path_out.create_dataset(label,data=path_in[label][()][mapping])
+                data = path_in[label][()] if mapping is None else path_in[label][()][mapping]
+                dtype = data.dtype if policy is None else _storage_dtype(policy,data.dtype)
+                path_out.create_dataset(label,data=data,dtype=dtype,
+                                        **({} if policy is None else _storage_options(policy,data.shape,dtype)))
                 path_out[label].attrs.update(path_in[label].attrs)
+                if dtype != data.dtype:
+                    path_out[label].attrs['original_dtype'] = str(data.dtype)
 
 
         with h5py.File(self.fname,'r') as f_in, h5py.File(fname,'w') as f_out:
@@ -2149,6 +3472,110 @@ class Result:
                                 cp(f_in[p],f_out[p],out,None if mapping is None else mappings[ty][label.encode()])
 
 
+    def follow(self,
+               fname: Union[str, Path],
+               output: Union[str, List[str]] = '*',
+               interval: float = 10.,
+               timeout: float = 600.) -> Generator["Result", None, None]:
+        """
+        Follow a DADF5 file that is still being written.
+
+        New increments are copied into a separate DADF5 file and
+        a view on them is returned for post-processing. Hence, the
+        DADF5 file is only read for a short time and derived datasets
+        do not interfere with the running simulation.
+
+        Parameters
+        ----------
+        fname : str or pathlib.Path
+            Name of the DADF5 file that receives the increments.
+            Increments that are already present are not copied again.
+        output : (list of) str, optional
+            Names of the datasets to copy.
+            Defaults to '*', in which case all visible datasets are copied.
+        interval : float, optional
+            Time in seconds between checks for new increments.
+            Defaults to 10.
+        timeout : float, optional
+            Time in seconds without modification of the DADF5 file after
+            which the simulation is considered as finished.
+            Defaults to 600.
+
+        Yields
+        ------
+        view : damask.Result
+            View on the new increments in the separate DADF5 file.
+
+        Notes
+        -----
+        The latest increment is copied only once the subsequent one
+        exists or the simulation is finished. An increment that the
+        solver still marks as being written is not copied, even if
+        'timeout' is reached. It is copied when following the DADF5
+        file again after the solver has completed it.
+        Reading failures, e.g. due to concurrent writing, are retried
+        after 'interval' until 'timeout' is reached.
+
+        Examples
+        --------
+        Export each new increment of a running simulation to VTK.
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> for r_new in r.follow('my_file_post.hdf5'):
+        ...     r_new.add_stress_Cauchy()
+        ...     r_new.export_VTK('sigma')
+
+        """
+        sidecar = Path(fname).expanduser().absolute()
+        if sidecar == self.fname:
+            raise PermissionError(f'cannot overwrite {self.fname}')
+        if self._region is not None:
+            raise NotImplementedError('following a spatial region')
+
+        r = re.compile(rf'{prefix_inc}([0-9]+)')
+        while True:
+            finished = time.time() - self.fname.stat().st_mtime >= timeout
+            new = []
+            try:
+                with _open_unlocked(self.fname) as f_in, h5py.File(sidecar,'a') as f_out:
+                    if 'geometry' not in f_out:
+                        f_out.attrs.update(f_in.attrs)
+                        for g in ['setup','geometry','cell_to']:
+                            f_in.copy(g,f_out)
+                    if 'incomplete' in f_out: del f_out['incomplete']
+
+                    increments = sorted([i for i in f_in.keys() if r.match(i)],key=util.natural_sort)
+                    link = f_in.get('current',getlink=True)                                         # removed by solver once written
+                    writing = link.path.strip('/') if isinstance(link,h5py.SoftLink) else None
+                    if finished and increments and increments[-1] == writing:
+                        print(f'Increment {writing} is incomplete, not copied.')
+                    for inc in increments if finished and increments[-1:] != [writing] else increments[:-1]:
+                        if inc in f_out: continue
+                        f_in.copy(inc,f_out,name='incomplete',shallow=True)                         # renamed once copied
+                        for label in ['u_p','u_n']:
+                            f_in[inc]['geometry'].copy(label,f_out['incomplete']['geometry'])
+                        for ty in ['phase','homogenization']:
+                            for label in f_in[inc][ty]:
+                                f_in[inc][ty].copy(label,f_out['incomplete'][ty],shallow=True)
+                            for label in self.visible[ty+'s']:
+                                for field in _match(self.visible['fields'],f_in['/'.join([inc,ty,label])].keys()):
+                                    p = '/'.join([inc,ty,label,field])
+                                    for out in _match(output,f_in[p].keys()):
+                                        f_in[p].copy(out,f_out['/'.join(['incomplete',ty,label,field])])
+                        f_out.move('incomplete',inc)
+                        new.append(inc)
+            except (OSError,KeyError) as err:
+                if finished: raise                                                                  # persistent failure
+                print(f'Could not read increments: {err}.')
+
+            if new:
+                yield Result(sidecar,self._workers,self._chunk_budget,self._storage,
+                             self._index is not None).view(increments=new)
+            if finished: return
+            time.sleep(interval)
+
+
     def export_simulation_setup(self,
                      output: Union[str, List[str]] = '*',
                      target_dir: Union[None, str, Path] = None,
@@ -1,7 +1,7 @@
 import os
 import multiprocessing as mp
 from pathlib import Path
-from typing import Optional, Union, Literal, List, Sequence
+from typing import Optional, Union, Literal, List, Sequence, Mapping
 
 import numpy as np
 from vtkmodules.vtkCommonCore import (
@@ -59,6 +59,35 @@ from . import Table
 from . import Colormap
 
 
+def _add_array(vtk_data,
+               label: str,
+               data: np.ndarray):
+    """Add data array to point and/or cell data of vtkDataSet."""
+    if isinstance(data,np.ma.MaskedArray):
+        data = np.where(data.mask,data.fill_value,data)
+
+    N_p,N_c = vtk_data.GetNumberOfPoints(),vtk_data.GetNumberOfCells()
+    if (N_data := data.shape[0]) not in [N_p,N_c]:
+        raise ValueError(f'data count mismatch ({N_data} ≠ {N_p} & {N_c})')
+
+    data_ = data.reshape(N_data,-1) \
+                .astype(np.single if data.dtype in [np.double,np.longdouble] else data.dtype)
+
+    if data.dtype.type is np.str_:
+        d = vtkStringArray()
+        for s in np.squeeze(data_):
+            d.InsertNextValue(s)
+    else:
+        d = numpy_to_vtk(data_,deep=True)
+
+    d.SetName(label)
+
+    if N_data == N_p:
+        vtk_data.GetPointData().AddArray(d)
+    if N_data == N_c:
+        vtk_data.GetCellData().AddArray(d)
+
+
 class VTK:
     """
     Spatial visualization (and potentially manipulation).
@@ -391,7 +420,8 @@ class VTK:
     @staticmethod
     def _write(writer):
         """Wrapper for parallel writing."""
-        writer.Write()
+        if writer.Write() != 1 or writer.GetErrorCode() != 0:                                      # Write() reports success on I/O errors
+            raise OSError(f'could not write "{writer.GetFileName()}"')
 
 
     def as_ASCII(self) -> str:
@@ -449,7 +479,7 @@ class VTK:
             except TypeError:
                 writer.Write()
         else:
-            writer.Write()
+            self._write(writer)
 
 
     # Check https://blog.kitware.com/ghost-and-blanking-visibility-changes/ for missing data
@@ -489,31 +519,6 @@ class VTK:
 
         """
 
-        def _add_array(vtk_data,
-                       label: str,
-                       data: np.ndarray):
-
-            N_p,N_c = vtk_data.GetNumberOfPoints(),vtk_data.GetNumberOfCells()
-            if (N_data := data.shape[0]) not in [N_p,N_c]:
-                raise ValueError(f'data count mismatch ({N_data} ≠ {N_p} & {N_c})')
-
-            data_ = data.reshape(N_data,-1) \
-                        .astype(np.single if data.dtype in [np.double,np.longdouble] else data.dtype)
-
-            if data.dtype.type is np.str_:
-                d = vtkStringArray()
-                for s in np.squeeze(data_):
-                    d.InsertNextValue(s)
-            else:
-                d = numpy_to_vtk(data_,deep=True)
-
-            d.SetName(label)
-
-            if N_data == N_p:
-                vtk_data.GetPointData().AddArray(d)
-            if N_data == N_c:
-                vtk_data.GetCellData().AddArray(d)
-
         if data is None and table is None:
             raise KeyError('no data given')
         if data is not None and table is not None:
@@ -522,9 +527,7 @@ class VTK:
         dup = self.copy()
         if isinstance(data,np.ndarray):
             if label is not None:
-                _add_array(dup.vtk_data,
-                           label,
-                           np.where(data.mask,data.fill_value,data) if isinstance(data,np.ma.MaskedArray) else data)
+                _add_array(dup.vtk_data,label,data)
                 if info is not None: dup.comments += [f'{label}: {info}']
             else:
                 raise ValueError('no label defined for data')
@@ -538,6 +541,43 @@ class VTK:
         return dup
 
 
+    def set_many(self,
+                 data: Mapping[str, Union[np.ndarray, np.ma.MaskedArray]],
+                 info: Optional[Mapping[str, str]] = None) -> 'VTK':
+        """
+        Add new or replace existing point or cell data in one go.
+
+        In contrast to repeated calls to 'set', the underlying
+        VTK dataset is copied only once.
+
+        Parameters
+        ----------
+        data : mapping of str to numpy.ndarray or numpy.ma.MaskedArray
+            Labels and data to add or replace. First array dimension needs
+            to match either number of cells or number of points.
+        info : mapping of str to str, optional
+            Human-readable information about the data of given labels.
+
+        Returns
+        -------
+        updated : damask.VTK
+            Updated VTK-based geometry.
+
+        Notes
+        -----
+        If the number of cells equals the number of points, the data is added to both.
+
+        """
+        dup = self.copy()
+        for label,d in data.items():
+            if not isinstance(d,np.ndarray): raise TypeError
+            _add_array(dup.vtk_data,label,d)
+        if info:
+            dup.comments += [f'{label}: {i}' for label,i in info.items() if label in data]
+
+        return dup
+
+
     def get(self,
             label: str) -> np.ndarray:
         """
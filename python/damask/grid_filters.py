@@ -10,11 +10,18 @@ the following operations are required for tensorial data:
     - D3 = D1.reshape(cells+(-1,),order='F').reshape(cells+(3,3))
     - D1 = D3.reshape(cells+(-1,)).reshape(-1,9,order='F')
 
+Operations in Fourier space are performed in the precision of the
+given field, i.e. single precision for fields of type numpy.float32.
+The number of threads used for the fast Fourier transforms can be
+set with scipy.fft.set_workers.
+
 """
 
+import functools as _functools
 from typing import Tuple as _Tuple
 
 from scipy import spatial as _spatial
+from scipy import fft as _fft
 import numpy as _np
 
 from ._typehints import FloatSequence as _FloatSequence, IntSequence as _IntSequence
@@ -49,6 +56,82 @@ def _ks(size: _FloatSequence,
     return _np.stack(_np.meshgrid(k_sk,k_sj,k_si,indexing = 'ij'), axis=-1)
 
 
+@_functools.lru_cache(maxsize=2)
+def _ks_cached(size: _Tuple[float, float, float],
+               cells: _Tuple[int, int, int],
+               first_order: bool,
+               dtype: _np.dtype) -> _np.ndarray:
+    """
+    Get read-only wave numbers operator of given type for reuse.
+
+    Notes
+    -----
+    Each cached operator holds cells[0]*cells[1]*(cells[2]//2+1)*3 values
+    and stays alive until evicted, e.g. about 200 MB for 256x256x256 cells
+    in double precision. Only two operators (first and second order of one
+    grid) are kept.
+
+    """
+    k_s = _ks(size,cells,first_order).astype(dtype)
+    k_s.flags.writeable = False
+    return k_s
+
+
+def _ks_like(size: _FloatSequence,
+             f: _np.ndarray,
+             first_order: bool = False) -> _np.ndarray:
+    """Get wave numbers operator matching grid and precision of a field."""
+    dtype = _np.float32 if f.dtype == _np.float32 else _np.float64
+    return _ks_cached(tuple(float(s) for s in size),tuple(int(c) for c in f.shape[:3]),
+                      first_order,_np.dtype(dtype))
+
+
+def _curl(size: _FloatSequence,
+          f: _np.ndarray,
+          batched: bool = False) -> _np.ndarray:
+    """Calculate curl of a (batch of) vector or tensor field(s) in Fourier space."""
+    n = _np.prod(f.shape[4 if batched else 3:])
+    k_s = _ks_like(size,f,True)
+
+    e = _np.zeros((3, 3, 3),k_s.dtype)
+    e[0, 1, 2] = e[1, 2, 0] = e[2, 0, 1] = +1.0                                                     # Levi-Civita symbol
+    e[0, 2, 1] = e[2, 1, 0] = e[1, 0, 2] = -1.0
+
+    f_fourier = _fft.rfftn(f,axes=(0,1,2))
+    curl_ = (_np.einsum('slm,ijkl,ijk...m ->ijk...s' if n == 3 else
+                        'slm,ijkl,ijk...nm->ijk...sn',e,k_s,f_fourier)*2.0j*_np.pi)                 # vector 3->3, tensor 3x3->3x3
+
+    return _fft.irfftn(curl_,axes=(0,1,2),s=f.shape[:3])
+
+
+def _divergence(size: _FloatSequence,
+                f: _np.ndarray,
+                batched: bool = False) -> _np.ndarray:
+    """Calculate divergence of a (batch of) vector or tensor field(s) in Fourier space."""
+    n = _np.prod(f.shape[4 if batched else 3:])
+    k_s = _ks_like(size,f,True)
+
+    f_fourier = _fft.rfftn(f,axes=(0,1,2))
+    divergence_ = (_np.einsum('ijkl,ijk...l ->ijk...' if n == 3 else
+                              'ijkm,ijk...lm->ijk...l', k_s,f_fourier)*2.0j*_np.pi)                 # vector 3->1, tensor 3x3->3
+
+    return _fft.irfftn(divergence_,axes=(0,1,2),s=f.shape[:3])
+
+
+def _gradient(size: _FloatSequence,
+              f: _np.ndarray,
+              batched: bool = False) -> _np.ndarray:
+    """Calculate gradient of a (batch of) scalar or vector field(s) in Fourier space."""
+    n = _np.prod(f.shape[4 if batched else 3:])
+    k_s = _ks_like(size,f,True)
+
+    f_fourier = _fft.rfftn(f,axes=(0,1,2))
+    gradient_ = (_np.einsum('ijk...l,ijkm->ijk...m' if n == 1 else
+                            'ijk...l,ijkm->ijk...lm',f_fourier,k_s)*2.0j*_np.pi)                    # scalar 1->3, vector 3->3x3
+
+    return _fft.irfftn(gradient_,axes=(0,1,2),s=f.shape[:3])
+
+
 def curl(size: _FloatSequence,
          f: _np.ndarray) -> _np.ndarray:
     u"""
@@ -67,18 +150,7 @@ def curl(size: _FloatSequence,
         Curl of f.
 
     """
-    n = _np.prod(f.shape[3:])
-    k_s = _ks(size,f.shape[:3],True)
-
-    e = _np.zeros((3, 3, 3))
-    e[0, 1, 2] = e[1, 2, 0] = e[2, 0, 1] = +1.0                                                     # Levi-Civita symbol
-    e[0, 2, 1] = e[2, 1, 0] = e[1, 0, 2] = -1.0
-
-    f_fourier = _np.fft.rfftn(f,axes=(0,1,2))
-    curl_ = (_np.einsum('slm,ijkl,ijkm ->ijks' if n == 3 else
-                        'slm,ijkl,ijknm->ijksn',e,k_s,f_fourier)*2.0j*_np.pi)                       # vector 3->3, tensor 3x3->3x3
-
-    return _np.fft.irfftn(curl_,axes=(0,1,2),s=f.shape[:3])
+    return _curl(size,f)
 
 
 def divergence(size: _FloatSequence,
@@ -99,14 +171,7 @@ def divergence(size: _FloatSequence,
         Divergence of f.
 
     """
-    n = _np.prod(f.shape[3:])
-    k_s = _ks(size,f.shape[:3],True)
-
-    f_fourier = _np.fft.rfftn(f,axes=(0,1,2))
-    divergence_ = (_np.einsum('ijkl,ijkl ->ijk' if n == 3 else
-                              'ijkm,ijklm->ijkl', k_s,f_fourier)*2.0j*_np.pi)                       # vector 3->1, tensor 3x3->3
-
-    return _np.fft.irfftn(divergence_,axes=(0,1,2),s=f.shape[:3])
+    return _divergence(size,f)
 
 
 def gradient(size: _FloatSequence,
@@ -127,14 +192,7 @@ def gradient(size: _FloatSequence,
         Gradient of f.
 
     """
-    n = _np.prod(f.shape[3:])
-    k_s = _ks(size,f.shape[:3],True)
-
-    f_fourier = _np.fft.rfftn(f,axes=(0,1,2))
-    gradient_ = (_np.einsum('ijkl,ijkm->ijkm' if n == 1 else
-                            'ijkl,ijkm->ijklm',f_fourier,k_s)*2.0j*_np.pi)                          # scalar 1->3, vector 3->3x3
-
-    return _np.fft.irfftn(gradient_,axes=(0,1,2),s=f.shape[:3])
+    return _gradient(size,f)
 
 
 def coordinates0_point(cells: _IntSequence,
@@ -82,6 +82,31 @@ class TestGeomGrid:
         g = GeomGrid(np.zeros((3,3,3)),np.ones(3))
         assert g.material.dtype in np.sctypes['int']
 
+    @pytest.mark.parametrize('low,high,dtype',[(0,255,np.int16),(-1,2**15-1,np.int16),
+                                               (0,2**15,np.int32),(-2**31,0,np.int32),
+                                               (0,2**32,np.int64)])
+    def test_compact_dtype(self,low,high,dtype):
+        g = GeomGrid(np.array([low,high]*4,np.int64).reshape(2,2,2),np.ones(3))
+        assert g.material.dtype == dtype
+        assert g.material.min() == low and g.material.max() == high
+
+    def test_material_inplace(self,default):
+        default.material[default.material==1] = -7
+        assert default.material.min() == -7 and 1 not in default.material
+
+    def test_compact_dtype_upcast(self,tmp_path):
+        g = GeomGrid(np.arange(8*8*8).reshape(8,8,8)%2**15,np.ones(3))
+        g.material[0,0,0] = 2**15-1
+        assert g.material.dtype == np.int16
+        assert g.vicinity_offset().material.max() == 2**16-1
+        assert g.add_primitive(2,[.5]*3,1).material.max() == 2**15
+        assert g.canvas(g.cells+1).material.max() == 2**15
+        assert g.substitute(1,-2**20).material.min() == -2**20
+        assert g.rotate(Rotation.from_axis_angle([0,0,1,45],degrees=True)).material.max() == 2**15
+        g.vicinity_offset().save(tmp_path/'upcast')
+        assert GeomGrid.load(tmp_path/'upcast.vti') == g.vicinity_offset()
+        assert GeomGrid.load(tmp_path/'upcast.vti').material.dtype == g.vicinity_offset().material.dtype
+
     def test_invalid_size(self,default):
         with pytest.raises(ValueError):
             GeomGrid(default.material[1:,1:,1:],
@@ -215,6 +240,33 @@ class TestGeomGrid:
         if update: modified.save(reference)
         assert GeomGrid.load(reference) == modified
 
+    @pytest.mark.parametrize('operation',[lambda g: g.canvas(g.cells+np.array([2,-3,4]),[-1,2,-3]),
+                                          lambda g: g.mirror('xz'),
+                                          lambda g: g.mirror('yz',reflect=True),
+                                          lambda g: g.renumber(),
+                                          lambda g: g.substitute([1,2,3],[30,1,2]),
+                                          lambda g: g.sort()])
+    def test_memmap(self,default,tmp_path,monkeypatch,operation):
+        monkeypatch.setattr('damask._geomgrid._slabs',
+                            lambda N_cells_layer,N_layers: (slice(z,min(z+3,N_layers)) for z in range(0,N_layers,3)))
+        np.save(tmp_path/'material.npy',np.asfortranarray(default.material))
+        memmapped = GeomGrid(np.load(tmp_path/'material.npy',mmap_mode='r'),default.size,default.origin)
+        modified = operation(memmapped)
+        assert isinstance(modified.material,np.memmap)
+        assert modified == operation(default)
+
+    @pytest.mark.parametrize('compress',[True,False])
+    def test_memmap_save(self,default,tmp_path,monkeypatch,compress):
+        monkeypatch.setattr('damask._geomgrid._slabs',
+                            lambda N_cells_layer,N_layers: (slice(z,min(z+3,N_layers)) for z in range(0,N_layers,3)))
+        np.save(tmp_path/'material.npy',default.material)
+        memmapped = GeomGrid(np.load(tmp_path/'material.npy',mmap_mode='r'),default.size,default.origin,
+                             {'T':np.random.rand(*default.cells)},default.comments)
+        memmapped.save(tmp_path/'memmapped',compress)
+        loaded = GeomGrid.load(tmp_path/'memmapped.vti')
+        assert loaded == memmapped and loaded.comments == memmapped.comments
+        assert np.allclose(loaded.initial_conditions['T'],memmapped.initial_conditions['T'])
+
     def test_renumber(self,default):
         material = default.material.copy()
         for m in np.unique(material):
@@ -400,6 +452,23 @@ class TestGeomGrid:
         Laguerre = GeomGrid.from_Laguerre_tessellation(cells,size,seeds,weights,periodic=np.random.random()>0.5)
         assert np.all(Laguerre.material == ms)
 
+    @pytest.mark.parametrize('periodic',[True,False])
+    @pytest.mark.parametrize('scale',[1.e-2,1.,1.e2])
+    def test_Laguerre_brute_force(self,periodic,scale):
+        cells  = np.random.randint(8,16,3)
+        size   = np.random.random(3) + 1.0
+        N_seeds= np.random.randint(3,30)
+        seeds  = np.random.rand(N_seeds,3) * np.broadcast_to(size,(N_seeds,3))
+        weights= np.random.random(N_seeds) * scale
+        shifts = np.array(np.meshgrid(*[[-1,0,1]]*3,indexing='ij')).reshape(3,-1).T*size if periodic else \
+                 np.zeros((1,3))
+        seeds_p = (seeds+shifts.reshape(-1,1,3)).reshape(-1,3)
+        coords = grid_filters.coordinates0_point(cells,size).reshape(-1,3)
+        power = np.sum((coords.reshape(-1,1,3)-seeds_p)**2,axis=-1) - np.tile(weights,len(shifts))
+        material = (np.argmin(power,axis=1)%N_seeds).reshape(cells)
+        Laguerre = GeomGrid.from_Laguerre_tessellation(cells,size,seeds,weights,periodic=periodic)
+        assert np.all(Laguerre.material == material)
+
     @pytest.mark.parametrize('approach',['Laguerre','Voronoi'])
     def test_tessellate_bicrystal(self,approach):
         cells = np.random.randint(5,10,3)*2
@@ -16,8 +16,13 @@ try:
     from vtkmodules.vtkIOXdmf2 import vtkXdmfReader
 except ImportError:
     vtkXdmfReader=None                                                                              # noqa type: ignore
+try:
+    from vtkmodules.vtkIOHDF import vtkHDFReader
+except ImportError:
+    vtkHDFReader=None                                                                               # noqa type: ignore
 import h5py
 import numpy as np
+from numpy import ma
 
 from damask import Result
 from damask import Orientation
@@ -25,14 +30,22 @@ from damask import VTK
 from damask import tensor
 from damask import mechanics
 from damask import grid_filters
+from damask._result import _WriterPool
+
 
+@pytest.fixture
+def default_factory(tmp_path,res_path):
+    """Create Result object with given keyword arguments for small Result file in temp location."""
+    def _default_factory(**kwargs):
+        fname = '12grains6x7x8_tensionY.hdf5'
+        shutil.copy(res_path/fname,tmp_path)
+        return Result(tmp_path/fname,**kwargs)
+    return _default_factory
 
 @pytest.fixture
-def default(tmp_path,res_path):
+def default(default_factory):
     """Small Result file in temp location for modification."""
-    fname = '12grains6x7x8_tensionY.hdf5'
-    shutil.copy(res_path/fname,tmp_path)
-    return Result(tmp_path/fname).view(times=20.0)
+    return default_factory().view(times=20.0)
 
 @pytest.fixture
 def single_phase(tmp_path,res_path):
@@ -128,6 +141,208 @@ class TestResult:
         eps = sign*1e-3
         assert [default.increments[inc]] == default.view(times=default.times[inc]+eps).visible['increments']
 
+    @pytest.mark.parametrize('workers',[1,3])
+    def test_add_workers(self,default_factory,workers):
+        r = default_factory(workers=workers).view(increments=range(0,40,8))
+        r.add_stress_Cauchy()
+        for inc in r.visible['increments']:
+            r_inc = r.view(increments=inc)
+            in_memory = mechanics.stress_Cauchy(r_inc.place('P'), r_inc.place('F'))
+            in_file   = r_inc.place('sigma')
+            assert np.allclose(in_memory,in_file)
+
+    @pytest.mark.parametrize('workers',[0,-1])
+    def test_invalid_workers(self,res_path,workers):
+        with pytest.raises(ValueError):
+            Result(res_path/'12grains6x7x8_tensionY.hdf5',workers=workers)
+
+    @pytest.mark.parametrize('chunk_budget',[1,3000,None])
+    def test_add_chunk_budget(self,default_factory,chunk_budget):
+        r = default_factory(chunk_budget=chunk_budget).view(increments=-1)
+        r.add_strain('F','V',0.0)
+        r.add_equivalent_Mises('epsilon_V^0.0(F)')
+        in_memory = mechanics.equivalent_strain_Mises(mechanics.strain(r.place('F'),'V',0.0))
+        in_file   = r.place('epsilon_V^0.0(F)_vM')
+        assert np.allclose(in_memory,in_file)
+
+    @pytest.mark.parametrize('storage',[{'compression':'lzf','chunk_size':4096,'checksum':False},
+                                        {'compression':None,'chunk_size':4096}])
+    def test_add_storage(self,default_factory,storage):
+        r = default_factory(storage=storage).view(increments=-1)
+        r.add_stress_Cauchy()
+        with h5py.File(r.fname,'r') as f:
+            dset = f['/'.join([r.increments[-1],'phase',r.phases[0],'mechanical','sigma'])]
+            assert dset.compression == storage['compression'] and dset.chunks[0] == 4096//(8*9)
+            assert dset.fletcher32 == storage.get('checksum',True)
+
+    def test_add_single_precision(self,default_factory):
+        r = default_factory(storage={'dtype':np.float32}).view(increments=-1)
+        r.add_stress_Cauchy()
+        r.add_calculation('np.ones(#sigma#.shape[0],dtype=np.int64)','N')
+        sigma = r.place('sigma')
+        assert sigma.dtype == np.float32 and sigma.dtype.metadata['original_dtype'] == 'float64'
+        assert np.allclose(sigma,mechanics.stress_Cauchy(r.place('P'),r.place('F')),rtol=1e-6)
+        assert r.place('N').dtype == np.int64
+
+    @pytest.mark.parametrize('dtype',[np.int32,'S2'])
+    def test_storage_invalid_dtype(self,res_path,dtype):
+        with pytest.raises(ValueError):
+            Result(res_path/'4grains2x4x3_compressionY.hdf5',storage={'dtype':dtype})
+
+    @pytest.mark.parametrize('keep',[None,'sigma_vM',['sigma_vM','epsilon_V^0.0(F)_vM']])
+    @pytest.mark.parametrize('chunk_budget',[3000,None])
+    def test_pipeline(self,default_factory,keep,chunk_budget):
+        r = default_factory(chunk_budget=chunk_budget).view(increments=-1)
+        with r.pipeline(keep=keep):
+            r.add_stress_Cauchy()
+            r.add_equivalent_Mises('sigma')
+            r.add_strain('F','V',0.0)
+            r.add_equivalent_Mises('epsilon_V^0.0(F)')
+            r.add_equivalent_Mises('does_not_exist')
+            assert r.get('sigma') is None
+        stored = set(r.get(flatten=False)[r.increments[-1]]['phase'][r.phases[0]]['mechanical'])
+        kept = {'sigma','sigma_vM','epsilon_V^0.0(F)','epsilon_V^0.0(F)_vM'} if keep is None else \
+               {keep} if isinstance(keep,str) else set(keep)
+        assert kept <= stored and not {'sigma','epsilon_V^0.0(F)'} - kept & stored
+        sigma = mechanics.stress_Cauchy(r.place('P'),r.place('F'))
+        assert np.allclose(r.place('sigma_vM'),mechanics.equivalent_stress_Mises(sigma))
+
+    def test_pipeline_spatial(self,default_factory):
+        r = default_factory().view(increments=-1)
+        with r.pipeline(keep='|curl(sigma)|_fro'):
+            r.add_stress_Cauchy()
+            r.add_curl('sigma')
+            r.add_norm('curl(sigma)')
+            r.add_equivalent_Mises('sigma')
+        stored = set(r.get(flatten=False)[r.increments[-1]]['phase'][r.phases[0]]['mechanical'])
+        assert {'sigma','curl(sigma)','|curl(sigma)|_fro'} <= stored and 'sigma_vM' not in stored
+        curl = grid_filters.curl(r.size,r.place('sigma').reshape(tuple(r.cells)+(3,3)))
+        assert np.allclose(r.place('|curl(sigma)|_fro').reshape(-1),np.linalg.norm(curl,axis=(-2,-1)).reshape(-1))
+
+    def test_pipeline_nested(self,default):
+        with pytest.raises(ValueError):
+            with default.pipeline():
+                with default.pipeline():
+                    pass
+        assert default._pipeline is None
+
+    def test_pipeline_view(self,default):
+        with default.pipeline():
+            v = default.view(increments=0)
+        v.add_stress_Cauchy()
+        assert v.get('sigma') is not None
+
+    def test_add_incremental(self,default_factory):
+        r = default_factory()
+        r.view(increments=[0,4]).add_stress_Cauchy()
+        with h5py.File(r.fname,'a') as f:
+            created = {inc:f['/'.join([inc,'phase',r.phases[0],'mechanical','sigma'])].attrs['created']
+                       for inc in r.increments[:2]}
+            sigma = f['/'.join([r.increments[1],'phase',r.phases[1],'mechanical','sigma'])]
+            sigma[...] = 0.
+            sigma.attrs['incomplete'] = True                                                        # interrupted
+        r.view(incremental=True).add_stress_Cauchy()
+        with h5py.File(r.fname,'r') as f:
+            for inc in r.increments[:2]:
+                assert f['/'.join([inc,'phase',r.phases[0],'mechanical','sigma'])].attrs['created'] == created[inc]
+            for inc in r.increments:
+                for ph in r.phases:
+                    assert 'incomplete' not in f['/'.join([inc,'phase',ph,'mechanical','sigma'])].attrs
+        for inc in r.increments:
+            r_inc = r.view(increments=inc)
+            assert np.allclose(r_inc.place('sigma'),mechanics.stress_Cauchy(r_inc.place('P'),r_inc.place('F')))
+
+    @pytest.mark.parametrize('protected',[True,False])
+    def test_add_incremental_outdated(self,default_factory,protected):
+        r = default_factory().view(increments=-1)
+        r.add_stress_Cauchy()
+        with h5py.File(r.fname,'a') as f:
+            f['/'.join([r.increments[-1],'phase',r.phases[0],'mechanical','P'])].attrs['created'] = \
+                '2999-01-01 00:00:00+0000'
+        r.view(incremental=True,protected=protected).add_stress_Cauchy()
+        with h5py.File(r.fname,'r') as f:
+            assert [protected,True] == ['overwritten' not in f['/'.join([r.increments[-1],'phase',ph,
+                                                                         'mechanical','sigma'])].attrs
+                                        for ph in r.phases]
+
+    def test_mappings_cache(self,res_path):
+        r = Result(res_path/'4grains2x4x3_compressionY.hdf5')
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = r.view(phases=['A','C'])._mappings()
+        assert r._cell_to and r.view(increments=0)._cell_to is r._cell_to
+        with h5py.File(r.fname,'r') as f:
+            for c in range(r.N_constituents):
+                for label in ['A','C']:
+                    at_cell = np.where(r.phase[:,c] == label)[0]
+                    assert np.array_equal(at_cell_ph[c][label],at_cell)
+                    assert np.array_equal(in_data_ph[c][label],f['cell_to/phase']['entry'][at_cell][:,c])
+            for label in r.homogenizations:
+                at_cell = np.where(r.homogenization == label)[0]
+                assert np.array_equal(at_cell_ho[label],at_cell)
+                assert np.array_equal(in_data_ho[label],f['cell_to/homogenization']['entry'][at_cell])
+
+    def test_view_shared_metadata(self,default):
+        v = default.view(increments=0).view_less(phases='*')
+        assert v.phase is default.phase and v.times is default.times
+        assert v.visible['phases'] == [] and default.visible['phases'] == default.phases
+        with pytest.raises(ValueError):
+            v.phase[0] = 'x'
+
+    @pytest.mark.parametrize('output',['F','Delta_V'])
+    def test_view_region_box(self,res_path,output):
+        r = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=-1)
+        box = r.view(region=([1,1,0],[2,4,2]))
+        assert np.all(box.cells == [1,3,2]) and np.allclose(box.size,r.size/r.cells*box.cells)
+        full = r.place(output,constituents=0).reshape(tuple(r.cells)+(-1,),order='F')
+        cropped = box.place(output,constituents=0).reshape(tuple(box.cells)+(-1,),order='F')
+        assert np.allclose(full[1:2,1:4,0:2],cropped)
+        assert np.allclose(box.get_timeseries(output)[0].reshape(cropped.shape,order='F'),cropped)
+        assert np.allclose(box.view(region=True).place(output,constituents=0),r.place(output,constituents=0))
+
+    def test_view_region_mask(self,default):
+        mask = np.zeros(default.cells,bool)
+        mask[2:4,1,3:] = mask[3,4,2] = True
+        r = default.view(region=mask)
+        assert np.all(r.cells == [2,4,6])
+        F = r.place('F').reshape(tuple(r.cells)+(3,3),order='F')
+        assert np.array_equal(~ma.getmaskarray(F)[...,0,0],mask[2:4,1:5,2:])
+        assert np.allclose(F[mask[2:4,1:5,2:]],default.place('F').reshape(tuple(default.cells)+(3,3),order='F')[mask])
+
+    def test_view_region_add(self,default):
+        r = default.view(increments=-1,region=([0,0,0],[3,7,8]))
+        r.add_determinant('F')
+        det = default.view(increments=-1).place('det(F)').reshape(default.cells,order='F')
+        assert np.all(np.isnan(det[3:])) and np.allclose(det[:3],np.linalg.det(r.place('F')).reshape(r.cells,order='F'))
+
+    def test_add_incremental_region(self,default):
+        r = default.view(increments=-1,incremental=True)
+        r.view(region=([0,0,0],[2,7,8])).add_determinant('F')
+        r.view(region=([4,0,0],[6,7,8])).add_determinant('F')
+        det = r.place('det(F)').reshape(default.cells,order='F')
+        ref = np.linalg.det(r.place('F')).reshape(default.cells,order='F')
+        assert np.all(np.isnan(det[2:4])) and np.allclose(det[:2],ref[:2]) and np.allclose(det[4:],ref[4:])
+        r.add_determinant('F')
+        assert np.allclose(r.place('det(F)').reshape(default.cells,order='F'),ref)
+        with h5py.File(r.fname,'r') as f:
+            for ph in r.phases:
+                assert not {'incomplete','partial'} & set(f['/'.join([r.increments[-1],'phase',ph,'mechanical','det(F)'])].attrs)
+
+    def test_view_region_export_vtk(self,default,tmp_path):
+        r = default.view(increments=-1,region=([1,2,3],[5,6,7]))
+        r.export_VTK(target_dir=tmp_path,parallel=False)
+        v = VTK.load(next(tmp_path.glob('*.vti')))
+        assert v.N_cells == np.prod(r.cells) and v.vtk_data.GetDimensions() == tuple(r.cells+1)
+        assert np.allclose(v.get('phase/mechanical/F / 1').reshape(-1,3,3),r.place('F'))
+
+    def test_view_region_invalid(self,default):
+        with pytest.raises(ValueError):
+            default.view(region=([0,0,0],[0,1,1]))
+        with pytest.raises(ValueError):
+            default.view(region=np.zeros(default.cells,bool))
+        with pytest.raises(ValueError):
+            default.view(region=False)
+        with pytest.raises(NotImplementedError):
+            default.view(region=([0,0,0],[1,1,1])).add_curl('F')
+
     def test_add_invalid(self,default):
         default.add_absolute('xxxx')
 
@@ -309,10 +524,35 @@ class TestResult:
             default.add_calculation('#invalid#*2')
 
     def test_add_generic_grid_invalid(self,res_path):
-        result = Result(res_path/'4grains2x4x3_compressionY.hdf5')
+        result = Result(res_path/'check_compile_job1.hdf5')
         with pytest.raises(NotImplementedError):
             result.add_curl('F')
 
+    def test_add_curl_constituents(self,res_path,tmp_path):
+        fname = '4grains2x4x3_compressionY.hdf5'
+        shutil.copy(res_path/fname,tmp_path)
+        r = Result(tmp_path/fname).view(increments=-1)
+        r.add_curl('F')
+        for c in range(r.N_constituents):
+            F = r.place('F',constituents=c)
+            in_file = r.place('curl(F)',constituents=c)
+            in_memory = grid_filters.curl(r.size,F.reshape(tuple(r.cells)+(3,3))).reshape(in_file.shape)
+            assert np.allclose(in_file,in_memory)
+
+    def test_add_curl_phase_view(self,default):
+        default.view(phases='pheno_bcc').add_curl('F')
+        F = default.place('F')
+        in_memory = grid_filters.curl(default.size,F.reshape(tuple(default.cells)+(3,3))).reshape(F.shape)
+        in_file = default.view(phases='pheno_bcc').place('curl(F)')
+        assert np.allclose(in_file[~in_file.mask],in_memory[~in_file.mask])
+        assert default.view(phases='pheno_fcc').place('curl(F)') is None
+
+    def test_add_curl_undefined(self,default,capsys):
+        default.view(phases='pheno_bcc').add_calculation('#F#','x','1','F in one phase')
+        default.add_curl('x')
+        assert 'not defined in all cells' in capsys.readouterr().out
+        assert default.place('curl(x)') is None
+
 
     @pytest.mark.parametrize('shape',['vector','tensor'])
     def test_add_curl(self,default,shape):
@@ -324,6 +564,18 @@ class TestResult:
         in_memory = grid_filters.curl(default.size,x.reshape(tuple(default.cells)+x.shape[1:])).reshape(in_file.shape)
         assert (in_file == in_memory).all()
 
+    @pytest.mark.parametrize('chunk_budget',[None,1])
+    @pytest.mark.parametrize('dtype',[None,np.float32])
+    def test_add_curl_batched(self,default_factory,chunk_budget,dtype):
+        r = default_factory(chunk_budget=chunk_budget,storage={'dtype':dtype})
+        r.add_curl('F')
+        for inc in r.increments:
+            F = r.view(increments=inc).place('F')
+            in_file = r.view(increments=inc).place('curl(F)')
+            in_memory = grid_filters.curl(r.size,F.reshape(tuple(r.cells)+(3,3))).reshape(in_file.shape)
+            assert in_file.dtype == (np.float64 if dtype is None else dtype)
+            assert np.allclose(in_file,in_memory,rtol=1e-4,atol=1e-4*np.max(np.abs(F))*np.max(r.cells/r.size))
+
     @pytest.mark.parametrize('shape',['vector','tensor'])
     def test_add_divergence(self,default,shape):
         if shape == 'vector': default.add_calculation('#F#[:,:,0]','x','1','just a vector')
@@ -450,6 +702,49 @@ class TestResult:
         single_phase.export_VTK(mode='point',target_dir=export_dir,parallel=False)
         assert set(os.listdir(export_dir)) == set([f'{single_phase.fname.stem}_inc{i:02}.vtp' for i in range(0,40+1,4)])
 
+    @pytest.mark.parametrize('workers',[1,3])
+    def test_vtk_parallel(self,tmp_path,res_path,patch_execution_stamp,workers):
+        result = Result(res_path/'12grains6x7x8_tensionY.hdf5',workers=workers)
+        result.export_VTK('F',target_dir=tmp_path/'parallel')
+        result.export_VTK('F',target_dir=tmp_path/'serial',parallel=False)
+        fnames = sorted(os.listdir(tmp_path/'serial'))
+        assert len(fnames) > 1 and fnames == sorted(os.listdir(tmp_path/'parallel'))
+        for fname in fnames:
+            assert VTK.load(tmp_path/'parallel'/fname) == VTK.load(tmp_path/'serial'/fname)
+
+    @pytest.mark.parametrize('fname,mode',[('12grains6x7x8_tensionY.hdf5','cell'),
+                                           ('12grains6x7x8_tensionY.hdf5','point'),
+                                           ('check_compile_job1.hdf5','cell')])
+    @pytest.mark.skipif(vtkHDFReader is None or vtkVersion.GetVTKMajorVersion()*100+vtkVersion.GetVTKMinorVersion() < 903,
+                        reason='VTKHDF time series require VTK 9.3')
+    def test_vtkhdf(self,tmp_path,res_path,fname,mode):
+        result = Result(res_path/fname)
+        result.export_VTKHDF(mode=mode,target_dir=tmp_path)
+        result.export_VTK(mode=mode,target_dir=tmp_path/'VTK',parallel=False)
+        reader = vtkHDFReader()
+        reader.SetFileName(str(tmp_path/f'{result.fname.stem}.vtkhdf'))
+        reader.UpdateInformation()
+        fnames = sorted(os.listdir(tmp_path/'VTK'))
+        assert reader.GetNumberOfSteps() == len(fnames)
+        for i,fname in enumerate(fnames):
+            reader.SetStep(i)
+            reader.Update()
+            series,single = VTK(reader.GetOutput()),VTK.load(tmp_path/'VTK'/fname)
+            assert series.N_cells == single.N_cells and series.N_points == single.N_points
+            for label in single.labels['Cell Data']:
+                assert np.allclose(single.get(label),series.get(label.replace('/','∕')),equal_nan=True)
+
+    def test_vtkhdf_invalid_mode(self,single_phase):
+        with pytest.raises(ValueError):
+            single_phase.export_VTKHDF(mode='invalid')
+
+    @pytest.mark.parametrize('N_processes',[0,2])
+    def test_vtk_writer_pool_invalid_path(self,tmp_path,res_path,N_processes):
+        v = VTK.from_image_data([2,3,4],np.ones(3))
+        with pytest.raises(OSError):
+            with _WriterPool(N_processes) as pool:
+                pool.submit(v,tmp_path/'does_not_exist'/'a.vti')
+
     def test_export_DREAM3D(self,tmp_path,res_path,h5py_dataset_iterator):
         result = Result(res_path/'2phase_irregularGrid_tensionX_material.hdf5').view(increments=0)  # compare the initial data only
         result.export_DREAM3D(target_dir=tmp_path)
@@ -512,9 +807,24 @@ class TestResult:
         bounds_vti = reader_vti.GetOutput().GetBounds()
         assert dim_vti == dim_xdmf and bounds_vti == bounds_xdmf
 
-    def test_XDMF_invalid(self,default):
+    def test_XDMF_invalid(self,res_path):
         with pytest.raises(NotImplementedError):
-            default.export_XDMF()
+            Result(res_path/'check_compile_job1.hdf5').export_XDMF()
+
+    @pytest.mark.skipif(not hasattr(vtkXdmfReader,'GetOutput'),reason='https://discourse.vtk.org/t/2450')
+    @pytest.mark.parametrize('fname',['12grains6x7x8_tensionY.hdf5','4grains2x4x3_compressionY.hdf5'])
+    def test_XDMF_virtual(self,tmp_path,res_path,fname):
+        result = Result(res_path/fname).view(increments=-1)
+        result.export_XDMF(target_dir=tmp_path/'XDMF')
+        result.export_VTK(target_dir=tmp_path/'VTK',parallel=False)
+        reader_xdmf = vtkXdmfReader()
+        reader_xdmf.SetFileName(tmp_path/'XDMF'/result.fname.with_suffix('.xdmf').name)
+        reader_xdmf.Update()
+        xdmf = VTK(reader_xdmf.GetOutput())
+        vti = VTK.load(next((tmp_path/'VTK').iterdir()))
+        assert xdmf.labels['Cell Data'] == vti.labels['Cell Data']
+        for label in vti.labels['Cell Data']:
+            assert np.allclose(xdmf.get(label),vti.get(label),equal_nan=True)
 
     def test_XDMF_custom_path(self,single_phase,tmp_path):
         os.chdir(tmp_path)
@@ -599,6 +909,97 @@ class TestResult:
             ref = pickle.load(f)
             assert cur is None if ref is None else dict_equal(cur,ref)
 
+    @pytest.mark.parametrize('view',[{},{'phases':['A','C']},{'phases':False}])
+    @pytest.mark.parametrize('output',['F','*',['O','u_n']])
+    def test_get_lazy(self,res_path,view,output):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=[0,8],**view)
+        eager = result.get(output,flatten=False)
+        lazy  = result.get(output,flatten=False,lazy=True)
+        def compare(e,l):
+            assert e.keys() == l.keys()
+            for k in e:
+                if isinstance(e[k],dict):
+                    compare(e[k],l[k])
+                else:
+                    assert np.array_equal(np.array(l[k]),e[k]) and e[k].dtype.metadata['unit'] == l[k].meta['unit']
+        if eager is None:
+            assert lazy is None
+        else:
+            compare(eager,lazy)
+
+    @pytest.mark.parametrize('view',[{},{'phases':['A','C']},{'homogenizations':False}])
+    @pytest.mark.parametrize('key',[slice(None),slice(3,17,2),5,[20,3,3,7],np.arange(24)%2==0])
+    def test_place_lazy(self,res_path,view,key):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=-1,**view)
+        eager = result.place(['F','Delta_V'],flatten=False)
+        lazy  = result.place(['F','Delta_V'],flatten=False,lazy=True)
+        def compare(e,l):
+            assert e.keys() == l.keys()
+            for k in e:
+                if isinstance(e[k],dict):
+                    compare(e[k],l[k])
+                else:
+                    a,b = ma.asarray(e[k][key]),ma.asarray(l[k][key])
+                    assert np.array_equal(ma.getmaskarray(a),ma.getmaskarray(b))
+                    assert np.allclose(a.filled(0),b.filled(0))
+                    assert e[k].dtype.metadata['unit'] == l[k].dtype.metadata['unit']
+        compare(eager,lazy)
+
+    @pytest.mark.parametrize('output',['F','Delta_V'])
+    @pytest.mark.parametrize('cells',[None,[3,22,5,5],slice(2,20,3),7])
+    def test_get_timeseries(self,res_path,output,cells):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=[0,4,8],phases=['A','C'])
+        cur = result.get_timeseries(output,cells)
+        for i,inc in enumerate(result.visible['increments']):
+            idx = np.atleast_1d(np.arange(result.N_materialpoints)[slice(None) if cells is None else cells])
+            ref = result.view(increments=inc).place(output,constituents=0)[idx]
+            assert np.array_equal(ma.getmaskarray(cur[i]),ma.getmaskarray(ref))
+            assert np.allclose(cur[i].filled(0),ref.filled(0))
+
+    def test_get_timeseries_none(self,res_path):
+        assert Result(res_path/'4grains2x4x3_compressionY.hdf5').get_timeseries('xxxx') is None
+
+    @pytest.mark.parametrize('chunk_budget',[None,100])
+    def test_reduce(self,default_factory,chunk_budget):
+        r = default_factory(chunk_budget=chunk_budget).view(increments=[0,20,40])
+        r.add_stress_Cauchy()
+        r.add_equivalent_Mises('sigma')
+        t = r.reduce('sigma_vM',['mean','std','min','max','hist'],bins=5)
+        assert np.all(t.get('increment').flatten() == [0,20,40]) and np.allclose(t.get('t').flatten(),[0.,10.,20.])
+        limits = [np.min(r.get_timeseries('sigma_vM')),np.max(r.get_timeseries('sigma_vM'))]
+        for i,inc in enumerate(r.visible['increments']):
+            sigma_vM = np.concatenate(list(r.view(increments=inc).get('sigma_vM').values()))
+            for op in ['mean','std','min','max']:
+                assert np.isclose(t.get(f'{op}(sigma_vM)')[i],getattr(np,op)(sigma_vM))
+            assert np.all(t.get('hist(sigma_vM)')[i] == np.histogram(sigma_vM,5,limits)[0])
+
+    def test_reduce_by_label(self,default):
+        t = default.reduce('F','mean',by='label')
+        for label in default.visible['phases']:
+            assert np.allclose(t.get(f'{label}/mean(F)'),np.mean(default.view(phases=label).get('F'),axis=0))
+
+    def test_reduce_invalid(self,default):
+        with pytest.raises(ValueError):
+            default.reduce('F','median')
+        with pytest.raises(ValueError):
+            default.reduce('F','hist')
+
+    @pytest.mark.parametrize('region',[None,([0,0,0],[2,2,3])])
+    @pytest.mark.parametrize('key',[[3,1,1],-1,(slice(None),0),([2,0],[1,1]),(slice(1,4),[0,2]),(Ellipsis,0,1),
+                                    np.array([[0,1],[1,0]]),(slice(None,None,-2),Ellipsis,2),()])
+    def test_lazy_indexing(self,res_path,region,key):
+        r = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=-1,phases='A',region=region)
+        F = r.get('F',lazy=True)
+        assert np.array_equal(F[key],np.array(F)[key])
+        F,F_ref = r.place('F',constituents=0,lazy=True),r.place('F',constituents=0)
+        assert np.array_equal(ma.getmaskarray(F[key]),ma.getmaskarray(F_ref[key]))
+        assert np.array_equal(F[key].filled(0),F_ref[key].filled(0))
+
+    def test_lazy_chunks(self,res_path):
+        F = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=-1,phases='A').get('F',lazy=True)
+        assert np.array_equal(np.concatenate(list(F.chunks(5))),np.array(F))
+        assert F.meta['unit'] == '1' and len(F) == F.shape[0]
+
     def test_simulation_setup_files(self,default):
         assert set(default.simulation_setup_files) == set(['12grains6x7x8.vti',
                                                             'material.yaml',
@@ -661,6 +1062,92 @@ class TestResult:
         assert str(r.get()) == str(r_exp.get())
         assert str(r.place()) == str(r_exp.place())
 
+    @pytest.mark.parametrize('storage',[{'compression':'lzf','chunk_size':1024},
+                                        {'compression':None,'checksum':False},
+                                        {'level':9,'chunk_size':512,'checksum':False,'dtype':np.float64}])
+    def test_export_DADF5_storage(self,res_path,tmp_path,h5py_dataset_iterator,storage):
+        r = Result(res_path/'4grains2x4x3_compressionY.hdf5')
+        r.export_DADF5(tmp_path/'rewritten.hdf5',storage=storage)
+        assert str(r.get()) == str(Result(tmp_path/'rewritten.hdf5').get())
+        with h5py.File(tmp_path/'rewritten.hdf5','r') as f:
+            for path,dset in h5py_dataset_iterator(f[r.increments[-1]]):
+                if 'phase' not in path: continue
+                assert dset.fletcher32 == storage.get('checksum',True)
+                if dset.nbytes >= 2*storage.get('chunk_size',1024**2):
+                    assert dset.compression == storage.get('compression','gzip')
+                    assert dset.chunks[0]*dset.dtype.itemsize*np.prod(dset.shape[1:]) <= storage['chunk_size']
+
+    def test_export_DADF5_single_precision(self,res_path,tmp_path):
+        r = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=-1)
+        r.export_DADF5(tmp_path/'single.hdf5',storage={'dtype':'f4'})
+        F = Result(tmp_path/'single.hdf5').view(increments=-1).place('F',constituents=0)
+        assert F.dtype == np.float32 and F.dtype.metadata['original_dtype'] == 'float64'
+        assert np.allclose(F,r.place('F',constituents=0))
+
+    @pytest.mark.parametrize('storage',[{'compression':'bzip2'},{'level':10},{'chunk_size':0},{'invalid':True}])
+    def test_storage_invalid(self,res_path,storage):
+        with pytest.raises((KeyError,ValueError)):
+            Result(res_path/'4grains2x4x3_compressionY.hdf5',storage=storage)
+
+    def test_follow(self,res_path,tmp_path):
+        complete = Result(res_path/'12grains6x7x8_tensionY.hdf5')
+        complete.view(increments=complete.increments[:2]).export_DADF5(tmp_path/'running.hdf5')
+        followed = []
+        for r in Result(tmp_path/'running.hdf5').view(phases='pheno_bcc') \
+                                               .follow(tmp_path/'post.hdf5',['F','P'],interval=.05,timeout=.5):
+            followed += r.visible['increments']
+            r.add_stress_Cauchy()
+            if len(followed) < 3:                                                                   # simulation proceeds
+                with h5py.File(complete.fname,'r') as f_in, h5py.File(tmp_path/'running.hdf5','a') as f_out:
+                    f_in.copy(complete.increments[len(followed)+1],f_out)
+        post = Result(tmp_path/'post.hdf5')
+        assert followed == post.increments == complete.increments[:4]
+        assert set(post.view(increments=-1).get()['phase']) == {'F','P','sigma'}
+        assert np.allclose(post.view(increments=-1).get('F'),complete.view(increments=complete.increments[3],phases='pheno_bcc').get('F'))
+
+    @pytest.mark.parametrize('fname',['12grains6x7x8_tensionY.hdf5',
+                                      '6grains6x7x8_single_phase_tensionY.hdf5'])
+    def test_index(self,res_path,tmp_path,fname,monkeypatch):
+        shutil.copy(res_path/fname,tmp_path)
+        r = Result(tmp_path/fname,index=True)
+        r_ref = Result(tmp_path/fname)
+        assert (tmp_path/fname).with_suffix('.index.json').is_file()
+        assert r.increments == r_ref.increments and r.fields == r_ref.fields
+        assert np.all(r.times == r_ref.times)
+        assert repr(r) == repr(r_ref)
+        r.view(increments=-1).add_stress_Cauchy()
+        assert r.view(increments=-1).list_data() == r_ref.view(increments=-1).list_data()
+        monkeypatch.setattr('damask._result._read_metadata',None)
+        assert repr(Result(tmp_path/fname,index=True)) == repr(r_ref)
+
+    def test_follow_incomplete(self,res_path,tmp_path):
+        complete = Result(res_path/'12grains6x7x8_tensionY.hdf5')
+        complete.view(increments=complete.increments[:2]).export_DADF5(tmp_path/'running.hdf5')
+        with h5py.File(tmp_path/'running.hdf5','a') as f:
+            f['current'] = h5py.SoftLink('/'+complete.increments[1])                               # still written by solver
+        os.utime(tmp_path/'running.hdf5',(0,0))
+        running = Result(tmp_path/'running.hdf5')
+        followed = [inc for r in running.follow(tmp_path/'post.hdf5',interval=.01,timeout=.1)
+                        for inc in r.visible['increments']]
+        assert followed == complete.increments[:1]
+        with h5py.File(tmp_path/'running.hdf5','a') as f:
+            del f['current']
+        os.utime(tmp_path/'running.hdf5',(0,0))
+        followed = [inc for r in running.follow(tmp_path/'post.hdf5',interval=.01,timeout=.1)
+                        for inc in r.visible['increments']]
+        assert followed == complete.increments[1:2]
+
+    def test_follow_corrupt(self,default,tmp_path):
+        with open(default.fname,'r+b') as f:
+            f.truncate(1024)
+        os.utime(default.fname,(0,0))
+        with pytest.raises(OSError):
+            next(default.follow(tmp_path/'post.hdf5',interval=.01,timeout=.1))
+
+    def test_follow_name_clash(self,default):
+        with pytest.raises(PermissionError):
+            next(default.follow(default.fname))
+
     @pytest.mark.parametrize('fname',['4grains2x4x3_compressionY.hdf5',
                                       '6grains6x7x8_single_phase_tensionY.hdf5'])
     def test_export_DADF5_name_clash(self,res_path,tmp_path,fname):
@@ -138,6 +138,10 @@ class TestVTK:
         with pytest.raises(FileNotFoundError):
             VTK.load('/dev/null')
 
+    def test_save_invalid_path(self,tmp_path,default):
+        with pytest.raises(OSError):
+            default.save(tmp_path/'does_not_exist'/'default.vti',parallel=False)
+
     def test_add_extension(self,tmp_path,default):
         default.save(tmp_path/'default.txt',parallel=False)
         assert os.path.isfile(tmp_path/'default.txt.vti')
@@ -192,6 +196,20 @@ class TestVTK:
             assert np.allclose(np.squeeze(d[k]['data']),new.get(k),rtol=1e-7)
 
 
+    def test_set_many(self,default):
+        data = {'scalar':np.random.rand(default.N_cells),
+                'vector':ma.MaskedArray(np.random.rand(default.N_points,3),mask=np.random.rand(default.N_points,3)<.3),
+                'tensor':np.random.rand(default.N_cells,3,3)}
+        info = {'scalar':'a scalar','tensor':'a tensor'}
+        chained = default
+        for label,d in data.items():
+            chained = chained.set(label,d,info.get(label))
+        assert default.set_many(data,info) == chained
+
+    def test_set_many_invalid_type(self,default):
+        with pytest.raises(TypeError):
+            default.set_many({'valid':'invalid_type'})
+
     def test_set_masked(self,default):
         data = np.random.rand(5*6*7,3)
         masked = ma.MaskedArray(data,mask=data<.4,fill_value=42.)
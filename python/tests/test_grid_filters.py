@@ -224,6 +224,28 @@ class TestGridFilters:
             field = np.ones(tuple(cells)+shape)*np.random.random()*1.0e5
             assert np.allclose(differential_operator(size,field),0.0)
 
+    @pytest.mark.parametrize('differential_operator',['curl','divergence','gradient'])
+    @pytest.mark.parametrize('shape',[(3,),(3,3)])
+    def test_differential_operator_batched(self,differential_operator,shape):
+        size = np.random.random(3)+1.0
+        cells = np.random.randint(8,16,(3))
+        if differential_operator == 'gradient': shape = shape[:1]
+        fields = np.random.random((4,)+tuple(cells)+shape)
+        batched = getattr(grid_filters,f'_{differential_operator}')(size,np.stack(fields,axis=3),batched=True)
+        for i,field in enumerate(fields):
+            assert np.allclose(batched[:,:,:,i],getattr(grid_filters,differential_operator)(size,field))
+
+    @pytest.mark.parametrize('differential_operator',[grid_filters.curl,
+                                                      grid_filters.divergence,
+                                                      grid_filters.gradient])
+    def test_differential_operator_single_precision(self,differential_operator):
+        size = np.random.random(3)+1.0
+        cells = np.random.randint(8,16,(3))
+        field = np.random.random(tuple(cells)+(3,))
+        single = differential_operator(size,field.astype(np.float32))
+        assert single.dtype == np.float32
+        assert np.allclose(single,differential_operator(size,field),rtol=1e-4,atol=1e-3*np.max(np.abs(single)))
+
 
     grad_test_data = [
     (['np.sin(np.pi*2*nodes[...,0]/size[0])', '0.0', '0.0'],